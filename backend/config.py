@@ -7,69 +7,143 @@ LLM 및 임베딩 모델 인스턴스를 생성하는 팩토리 함수를 제공
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from glob import glob
-from dotenv import load_dotenv
 
-# 프로젝트 루트 경로 (backend의 부모 디렉토리)
-# 모든 상대 경로는 이 경로를 기준으로 해석됩니다
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
-# .env 파일에서 환경 변수 로드
-env_path = PROJECT_ROOT / '.env'
-load_dotenv(dotenv_path=env_path)
+@lru_cache(maxsize=1)
+def _project_root() -> Path:
+    # 프로젝트 루트 경로 (backend의 부모 디렉토리)
+    # 모든 상대 경로는 이 경로를 기준으로 해석됩니다
+    return Path(__file__).resolve().parents[1]
 
 
-@dataclass
+def _env(name: str, default: str = ''):
+    # 환경 변수를 클래스 정의 시점이 아니라 Settings 생성 시점(.env 로드 이후)에 읽는다
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+@dataclass(slots=True, frozen=True)
 class Settings:
     """
     애플리케이션 전역 설정을 담는 데이터클래스
 
     모든 설정값은 .env 파일에서 읽어오며, 기본값도 제공합니다.
+    get_settings()가 캐싱한 단일 인스턴스를 여러 스레드가 공유하므로
+    생성 이후에는 변경할 수 없도록 frozen으로 정의합니다.
     """
     # API 키
-    openai_api_key: str = os.getenv('OPENAI_API_KEY', '')
+    openai_api_key: str = _env('OPENAI_API_KEY', '')
 
     # 데이터 경로 설정
-    data_dir: str = os.getenv('DATA_DIR', 'backend/data')  # 데이터 디렉토리
-    raw_json: str = os.getenv('RAW_JSON', 'backend/data/merged_university_courses.json')  # 원본 JSON 파일 (glob 패턴 지원)
-    vector_store_path: str = os.getenv('VECTORSTORE_PATH', 'backend/data/processed/courses.parquet')  # 미사용 (레거시)
-    vectorstore_dir: str = os.getenv('VECTORSTORE_DIR', 'backend/data/vector_db')  # Vector DB 저장 경로
-    major_detail_path: str = os.getenv('MAJOR_DETAIL_PATH', 'backend/data/major_detail.json')  # 전공 세부 정보 데이터
+    data_dir: str = _env('DATA_DIR', 'backend/data')  # 데이터 디렉토리
+    raw_json: str = _env('RAW_JSON', 'backend/data/merged_university_courses.json')  # 원본 JSON 파일 (glob 패턴 지원)
+    vector_store_path: str = _env('VECTORSTORE_PATH', 'backend/data/processed/courses.parquet')  # 미사용 (레거시)
+    vectorstore_dir: str = _env('VECTORSTORE_DIR', 'backend/data/vector_db')  # Vector DB 저장 경로
+    major_detail_path: str = _env('MAJOR_DETAIL_PATH', 'backend/data/major_detail.json')  # 전공 세부 정보 데이터
 
     # LLM 설정
-    llm_provider: str = os.getenv('LLM_PROVIDER', 'openai')  # LLM 제공자: openai, ollama, huggingface
-    model_name: str = os.getenv('MODEL_NAME', 'gpt-4o-mini')  # 사용할 모델 이름
+    llm_provider: str = _env('LLM_PROVIDER', 'openai')  # LLM 제공자: openai, ollama, huggingface
+    model_name: str = _env('MODEL_NAME', 'gpt-4o-mini')  # 사용할 모델 이름
 
     # 임베딩 설정
-    embedding_model_name: str = os.getenv('EMBEDDING_MODEL_NAME', 'text-embedding-3-small')  # 임베딩 모델 (한국어 특화)
-    embedding_provider: str = os.getenv('EMBEDDING_PROVIDER', 'openai')  # 임베딩 제공자: openai, huggingface
+    embedding_model_name: str = _env('EMBEDDING_MODEL_NAME', 'text-embedding-3-small')  # 임베딩 모델 (한국어 특화)
+    embedding_provider: str = _env('EMBEDDING_PROVIDER', 'openai')  # 임베딩 제공자: openai, huggingface
+
+    # 로컬 HuggingFace 모델 실행 디바이스 (cuda, cpu 등). 비워두면 자동 감지
+    # 임베딩 모델을 생성할 때 resolve_device()가 읽으므로 .env에 설정해도 적용됨
+    device: str = _env('KONKUK_DEVICE', '')
+
+    # 최종 답변에 언급된 학과의 후속 질문 임베딩을 백그라운드로 미리 계산할지 여부
+    # (추측성 Pinecone/임베딩 호출이므로 적중률을 측정하기 전까지 기본값은 끔)
+    followup_prefetch: bool = field(
+        default_factory=lambda: os.getenv('FOLLOWUP_PREFETCH', 'false').strip().lower() in ('1', 'true', 'yes')
+    )
 
     # Pinecone 설정 (전공 벡터 인덱스용)
-    pinecone_api_key: str = os.getenv('PINECONE_API_KEY', '')
-    pinecone_environment: str = os.getenv('PINECONE_ENVIRONMENT', '')
-    pinecone_region: str = os.getenv('PINECONE_REGION', '')
-    pinecone_cloud: str = os.getenv('PINECONE_CLOUD', 'aws')
-    pinecone_index_name: str = os.getenv('PINECONE_INDEX_NAME', 'majors-index')
-    pinecone_namespace: str = os.getenv('PINECONE_NAMESPACE', 'majors')
-    pinecone_dimension: int = int(os.getenv('PINECONE_DIMENSION', '0') or '0')
+    pinecone_api_key: str = _env('PINECONE_API_KEY', '')
+    pinecone_environment: str = _env('PINECONE_ENVIRONMENT', '')
+    pinecone_region: str = _env('PINECONE_REGION', '')
+    pinecone_cloud: str = _env('PINECONE_CLOUD', 'aws')
+    pinecone_index_name: str = _env('PINECONE_INDEX_NAME', 'majors-index')
+    pinecone_namespace: str = _env('PINECONE_NAMESPACE', 'majors')
+    pinecone_dimension: int = field(default_factory=lambda: int(os.getenv('PINECONE_DIMENSION', '0') or '0'))
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
-    설정 인스턴스 반환
+    설정 인스턴스 반환 (프로세스당 한 번만 생성되어 캐싱됨)
+
+    첫 호출 시에만 .env 파일을 로드하므로, 설정이 필요 없는 모듈은
+    config를 import하는 것만으로 파일 I/O 비용을 치르지 않습니다.
 
     Returns:
         Settings: .env 파일에서 로드된 설정값을 담은 Settings 인스턴스
     """
+    from dotenv import load_dotenv
+
+    # .env 파일에서 환경 변수 로드
+    load_dotenv(dotenv_path=_project_root() / '.env')
     return Settings()
 
+
+def resolve_device() -> str:
+    """
+    로컬 HuggingFace 모델(임베딩 등)을 실행할 디바이스를 결정
+
+    KONKUK_DEVICE 환경 변수가 설정되어 있으면 그 값을 그대로 사용하고,
+    없으면 CUDA 사용 가능 여부에 따라 'cuda' 또는 'cpu'를 반환합니다.
+    torch는 이 함수가 호출될 때만 import됩니다.
+
+    Returns:
+        str: 'cuda', 'cpu' 등 디바이스 문자열
+    """
+    device = get_settings().device.strip()
+    if device:
+        return device
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+@lru_cache(maxsize=1)
+def get_http_client():
+    """
+    OpenAI 호환 API 호출에 공유하는 httpx 클라이언트를 반환 (프로세스당 1개)
+
+    LLM과 임베딩 클라이언트가 같은 커넥션 풀을 사용하여, 두 번째 호출부터는
+    TCP/TLS 핸드셰이크 없이 keep-alive 연결을 재사용합니다.
+    h2 패키지가 설치되어 있으면 HTTP/2로 하나의 연결에서 요청을 다중화합니다.
+
+    Returns:
+        httpx.Client 인스턴스
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요한 선택 의존성)
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
+
+
 def get_llm():
     """
-    LLM(대형 언어 모델) 인스턴스를 생성하는 팩토리 함수
+    LLM(대형 언어 모델) 인스턴스를 반환하는 팩토리 함수
 
     .env 파일의 LLM_PROVIDER 설정에 따라 적절한 LangChain ChatModel을 생성합니다.
+    생성된 클라이언트는 (provider, model_name) 단위로 캐싱되어, 반복 호출 시
+    엔드포인트/HTTP 클라이언트를 다시 만들지 않고 같은 인스턴스를 재사용합니다.
 
     지원하는 제공자:
       - openai: OpenAI API 또는 호환 서버 (vLLM, Together AI 등)
@@ -83,7 +157,14 @@ def get_llm():
         ValueError: 지원하지 않는 LLM_PROVIDER가 설정된 경우
     """
     settings = get_settings()
-    provider = settings.llm_provider.lower()
+    return _create_llm(settings.llm_provider.lower(), settings.model_name)
+
+
+@lru_cache(maxsize=None)
+def _create_llm(provider: str, model_name: str):
+    # (provider, model_name) 조합별로 한 번만 생성되도록 lru_cache로 캐싱
+    # 각 제공자 SDK는 해당 분기에서만 import하여 불필요한 로딩을 피한다
+    settings = get_settings()
 
     if provider == "openai":
         # OpenAI API 또는 호환 서버 사용
@@ -96,16 +177,18 @@ def get_llm():
         if base_url:
             # 커스텀 API 서버 사용
             return ChatOpenAI(
-                model=settings.model_name,
+                model=model_name,
                 base_url=base_url,  # OpenAI 호환 API 서버 주소
                 api_key=settings.openai_api_key,
                 temperature=0.1,  # 툴 호출 신뢰성을 위해 낮은 온도 사용
+                http_client=get_http_client(),  # 공유 커넥션 풀 재사용
             )
         else:
             # 공식 OpenAI API 사용
             return ChatOpenAI(
-                model=settings.model_name,
+                model=model_name,
                 temperature=0.1,  # 툴 호출 신뢰성을 위해 낮은 온도 사용
+                http_client=get_http_client(),  # 공유 커넥션 풀 재사용
             )
 
     elif provider == "ollama":
@@ -124,7 +207,7 @@ def get_llm():
         base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
         return ChatOllama(
-            model=settings.model_name,
+            model=model_name,
             temperature=0.7,  # 창의성 조절 (0.0 = 결정적, 1.0 = 창의적)
             base_url=base_url,  # .env의 OLLAMA_BASE_URL 또는 기본값
         )
@@ -137,7 +220,7 @@ def get_llm():
 
         # HuggingFace 엔드포인트 생성
         endpoint = HuggingFaceEndpoint(
-            repo_id=settings.model_name,  # 예: "Qwen/Qwen2.5-7B-Instruct"
+            repo_id=model_name,  # 예: "Qwen/Qwen2.5-7B-Instruct"
             huggingfacehub_api_token=hf_token or None,
         )
         return ChatHuggingFace(llm=endpoint)
@@ -145,7 +228,7 @@ def get_llm():
     else:
         # 지원하지 않는 제공자
         raise ValueError(
-            f"Unsupported LLM_PROVIDER: {settings.llm_provider}. "
+            f"Unsupported LLM_PROVIDER: {provider}. "
             "Use one of ['openai', 'ollama', 'huggingface']."
         )
 
@@ -154,7 +237,7 @@ def resolve_path(path_str: str) -> Path:
     """
     경로 문자열을 프로젝트 루트 기준의 절대 경로로 변환
 
-    상대 경로가 주어지면 프로젝트 루트(PROJECT_ROOT)를 기준으로 변환하고,
+    상대 경로가 주어지면 프로젝트 루트를 기준으로 변환하고,
     절대 경로가 주어지면 그대로 반환합니다.
 
     Args:
@@ -167,29 +250,5 @@ def resolve_path(path_str: str) -> Path:
     path = Path(path_str)
     if path.is_absolute():
         return path  # 이미 절대 경로면 그대로 반환
-    return PROJECT_ROOT / path  # 상대 경로면 프로젝트 루트 기준으로 변환
+    return _project_root() / path  # 상대 경로면 프로젝트 루트 기준으로 변환
 
-
-def expand_paths(path_pattern: str) -> list[Path]:
-    """
-    Glob 패턴을 확장하여 매칭되는 모든 파일 경로를 반환
-
-    프로젝트 루트를 기준으로 glob 패턴을 확장합니다.
-    여러 데이터 파일을 한 번에 로드할 때 유용합니다.
-
-    Args:
-        path_pattern: Glob 패턴 또는 직접 경로
-                      예: "backend/data/raw/*.json" → raw 폴더의 모든 JSON 파일
-                          "backend/data/*.json" → data 폴더의 모든 JSON 파일
-
-    Returns:
-        list[Path]: 패턴에 매칭되는 파일들의 경로 리스트
-
-    Raises:
-        FileNotFoundError: 패턴에 매칭되는 파일이 하나도 없는 경우
-    """
-    pattern_path = resolve_path(path_pattern)
-    matches = [Path(p) for p in glob(str(pattern_path))]
-    if not matches:
-        raise FileNotFoundError(f"No files matched pattern: {path_pattern}")
-    return matches
@@ -7,12 +7,13 @@ LangGraph 그래프를 빌드하는 팩토리 함수들을 정의합니다.
 2. **Major 그래프**: 온보딩 기반 전공 추천 전용
 """
 
+import functools
+
 from langgraph.graph import StateGraph
 from langgraph.constants import END
-from langgraph.prebuilt import ToolNode
 from .state import MentorState
 from .nodes import (
-    agent_node, should_continue, tools,
+    agent_node, should_continue, TOOL_NODE,
     recommend_majors_node,
 )
 
@@ -20,6 +21,9 @@ def build_graph(mode: str = "react"):
     """
     멘토 시스템 그래프를 빌드합니다.
 
+    컴파일된 그래프는 입력 상태와 무관하게 재사용 가능하므로 mode별로 한 번만
+    빌드하여 캐싱합니다. (동시 요청 간에도 같은 앱을 공유해도 안전)
+
     Args:
         mode: 그래프 실행 모드
             - "react": ReAct 에이전트 방식 (LLM이 tool 호출 여부 자율 결정)
@@ -31,6 +35,14 @@ def build_graph(mode: str = "react"):
     Raises:
         ValueError: 지원하지 않는 mode가 입력된 경우
     """
+    # build_graph("react"), build_graph(mode="react"), build_graph()가 lru_cache에서
+    # 서로 다른 키가 되지 않도록 mode를 위치 인자 하나로 정규화해 캐시 함수에 넘긴다
+    return _build_graph(mode)
+
+
+@functools.lru_cache(maxsize=2)
+def _build_graph(mode: str):
+    # build_graph의 mode별 캐시 본체
     if mode == "react":
         return build_react_graph()
     elif mode == "major":  # 온보딩 기반 전공 추천 파이프라인 전용
@@ -69,7 +81,7 @@ def build_react_graph():
     graph.add_node("agent", agent_node)  # 핵심 에이전트 노드
     # 툴 실행 노드 - LangGraph가 여러 tool call을 병렬 실행하더라도
     # vectorstore.py의 _VECTORSTORE_LOCK이 동시 접근을 방지함
-    graph.add_node("tools", ToolNode(tools))
+    graph.add_node("tools", TOOL_NODE)
 
     # 엣지 설정
     graph.set_entry_point("agent")  # 그래프 시작점
@@ -3,6 +3,17 @@ Helper functions for agent_node preprocessing
 """
 import re
 
+# 질문이 명확한 경우를 나타내는 단어들 (모듈 import 시 한 번만 컴파일)
+_QUESTION_WORDS_RE = re.compile(
+    "|".join(map(re.escape, ['어디', '어떤', '무엇', '왜', '어떻게', '얼마', '?', '알려', '추천', '비슷', '유사']))
+)
+
+# 학과 관련 키워드
+_MAJOR_KEYWORDS_RE = re.compile(
+    "|".join(map(re.escape, ['과', '학과', '공학', '교육', '대학']))
+)
+
+
 def is_single_major_query(query: str) -> bool:
     """
     단일 학과명 질문인지 감지
@@ -21,13 +32,11 @@ def is_single_major_query(query: str) -> bool:
         return False
     
     # 질문이 명확한 경우 제외
-    question_words = ['어디', '어떤', '무엇', '왜', '어떻게', '얼마', '?', '알려', '추천', '비슷', '유사']
-    if any(word in query for word in question_words):
+    if _QUESTION_WORDS_RE.search(query):
         return False
     
     # 학과 관련 키워드 포함 여부
-    major_keywords = ['과', '학과', '공학', '교육', '대학']
-    has_major_keyword = any(keyword in query for keyword in major_keywords)
+    has_major_keyword = _MAJOR_KEYWORDS_RE.search(query) is not None
     
     # 짧고 학과 키워드가 있으면 단일 학과명 쿼리로 판단
     if len(query) <= 15 and has_major_keyword:
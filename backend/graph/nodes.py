@@ -5,17 +5,28 @@ LangGraph 그래프를 구성하는 노드 함수들을 정의합니다.
 ReAct 패턴: LLM이 자율적으로 tool 호출 여부를 결정 (agent_node, should_continue)
 """
 
+import functools
+import heapq
+import logging
 import re
-from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage, AIMessage
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TypedDict
+import numpy as np
+from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, trim_messages
 from langgraph.prebuilt import ToolNode
-from langgraph.constants import END
 
 from .state import MentorState
 from backend.rag.retriever import (
+    _SEARCH_EXECUTOR,
     search_major_docs,
     aggregate_major_scores,
+    SerializedHit,
 )
-from backend.rag.embeddings import get_embeddings
+from backend.rag.embeddings import get_cached_embeddings
 
 from backend.rag.tools import (
     list_departments,
@@ -23,21 +34,26 @@ from backend.rag.tools import (
     get_major_career_info,
     get_search_help,
     get_university_admission_info,
+    _expand_category_query,
+    _find_majors_batch,
+    _lookup_major_by_name,
 )
+from .helper import is_single_major_query, enhance_single_major_query
 
-from backend.config import get_llm
+from backend.config import get_llm, get_settings
 
-# LLM 인스턴스 생성 (.env에서 설정한 LLM_PROVIDER와 MODEL_NAME 사용)
-llm = get_llm()
+logger = logging.getLogger(__name__)
 
 # doc_type별 기본 가중치 (관심사/과목 비중을 약간 높게 설정)
-MAJOR_DOC_WEIGHTS = {
+_RAW_MAJOR_DOC_WEIGHTS = {
     "summary": 1.0,
     "interest": 1.1,
     "property": 0.9,
     "subjects": 1.2,
     "jobs": 1.0,
 }
+# 요청 처리 중 실수로 수정되지 않도록 읽기 전용 뷰로 노출
+MAJOR_DOC_WEIGHTS = MappingProxyType(_RAW_MAJOR_DOC_WEIGHTS)
 
 
 # ==================== ReAct 에이전트용 설정 ====================
@@ -49,105 +65,203 @@ tools = [
     get_search_help,
     get_university_admission_info,
 ]  # 사용 가능한 툴 목록
-llm_with_tools = llm.bind_tools(tools)  # LLM에 툴 사용 권한 부여
+# 툴 실행 노드 - 툴 스키마 분석은 모듈 로드 시 한 번만 수행하고 그래프 간 공유 (상태 없음)
+TOOL_NODE = ToolNode(tools)
+
+
+# LLM 인스턴스는 모듈 import 시점이 아니라 첫 사용 시점에 생성한다.
+# (graph_builder 등 nodes를 import만 하는 곳에서 LLM SDK 로딩 비용을 치르지 않도록)
+@functools.lru_cache(maxsize=1)
+def _get_llm():
+    # .env에서 설정한 LLM_PROVIDER와 MODEL_NAME 사용
+    return get_llm()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_with_tools():
+    # LLM에 툴 사용 권한 부여
+    return _get_llm().bind_tools(tools)
+
+
+class _NormalizedMajors(TypedDict):
+    """사용자가 입력한 전공명을 표준 학과명으로 변환한 결과"""
+    majors: list[str]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_major_normalizer():
+    # 제공자의 구조화 출력(스키마 기반 constrained decoding)을 사용하는 LLM
+    # 지원하지 않는 제공자(일부 Ollama/HuggingFace 모델)는 None → 텍스트 파싱 경로 사용
+    try:
+        return _get_llm().with_structured_output(_NormalizedMajors)
+    except NotImplementedError:
+        return None
+
+
+def __getattr__(name: str):
+    # 기존 `nodes.llm`, `nodes.llm_with_tools` 접근을 지연 로딩으로 유지 (PEP 562)
+    if name == "llm":
+        return _get_llm()
+    if name == "llm_with_tools":
+        return _get_llm_with_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def prewarm() -> None:
+    """
+    요청 경로 밖에서 임베딩 모델을 미리 로드합니다.
+
+    앱 시작 시 main.warmup()이 한 번 호출하여, 첫 요청이 모델 로딩 시간을 떠안지 않도록 합니다.
+    (그래프 빌드와 분리되어 있어 visualize_graph 등은 모델을 로드하지 않음)
+    """
+    get_cached_embeddings()
+
+
+def _format_iterable(value) -> str:
+    # 항목별 str().strip()은 한 번만 계산하고 빈 값은 건너뜀
+    return ", ".join(text for text in (str(item).strip() for item in value) if text)
+
+
+def _format_dict(value) -> str:
+    parts = []
+    for key, sub_value in value.items():
+        sub_text = _format_profile_value(sub_value)
+        if sub_text:
+            parts.append(f"{key}: {sub_text}")
+    return "; ".join(parts)
+
+
+# 정확한 타입 → 포맷 함수 매핑 (isinstance 체인 대신 dict 조회 한 번으로 분기)
+_FORMATTERS = {
+    str: str.strip,
+    list: _format_iterable,
+    tuple: _format_iterable,
+    set: _format_iterable,
+    dict: _format_dict,
+    type(None): lambda value: "",
+}
 
 
 def _format_profile_value(value) -> str:
     # 온보딩 답변이 리스트/딕셔너리 등 다양한 형태여서 문자열로 균일하게 변환
-    if value is None:
-        return ""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    # 하위 클래스(OrderedDict 등)는 isinstance로 처리
     if isinstance(value, str):
         return value.strip()
     if isinstance(value, (list, tuple, set)):
-        items = [str(item).strip() for item in value if str(item).strip()]
-        return ", ".join(items)
+        return _format_iterable(value)
     if isinstance(value, dict):
-        parts = []
-        for key, sub_value in value.items():
-            sub_text = _format_profile_value(sub_value)
-            if sub_text:
-                parts.append(f"{key}: {sub_text}")
-        return "; ".join(parts)
+        return _format_dict(value)
     return str(value)
 
 
-def _build_user_profile_text(answers: dict, fallback_question: str | None) -> str:
-    # 학생의 선호 정보를 한 덩어리 텍스트로 만들어 임베딩에 활용
-    if not answers and not fallback_question:
-        return ""
+# 온보딩 답변 중 라벨을 붙여 우선 배치할 항목 (순서 유지)
+_PROFILE_ORDERED_KEYS = (
+    ("preferred_majors", "관심 전공"),
+    ("subjects", "좋아하는 과목"),
+    ("interests", "관심사/취미"),
+    ("activities", "교내/대외 활동"),
+    ("desired_salary", "희망 연봉"),
+    ("career_goal", "진로 목표"),
+    ("strengths", "강점"),
+)
+_PROFILE_ORDERED_KEY_SET = frozenset(key for key, _ in _PROFILE_ORDERED_KEYS)
 
-    ordered_keys = [
-        ("preferred_majors", "관심 전공"),
-        ("subjects", "좋아하는 과목"),
-        ("interests", "관심사/취미"),
-        ("activities", "교내/대외 활동"),
-        ("desired_salary", "희망 연봉"),
-        ("career_goal", "진로 목표"),
-        ("strengths", "강점"),
-    ]
 
-    sections: list[str] = []
-    used_keys = {key for key, _ in ordered_keys}
+def _iter_profile_sections(answers: dict, fallback_question: str | None):
+    # 학생의 선호 정보를 항목별 문장으로 하나씩 생성
+    fallback = fallback_question.strip() if fallback_question else ""
 
-    for field, label in ordered_keys:
-        value = answers.get(field)
-        formatted = _format_profile_value(value)
-        if formatted:
-            sections.append(f"{label}: {formatted}")
+    # 온보딩 답변이 없으면 (첫 턴 등) 항목 순회를 건너뛰고 추가 요청만 생성
+    if answers:
+        for field, label in _PROFILE_ORDERED_KEYS:
+            formatted = _format_profile_value(answers.get(field))
+            if formatted:
+                yield f"{label}: {formatted}"
 
-    # Capture any extra onboarding answers that were not explicitly mapped.
-    for key, value in answers.items():
-        if key in used_keys:
-            continue
-        formatted = _format_profile_value(value)
-        if formatted:
-            sections.append(f"{key}: {formatted}")
+        # Capture any extra onboarding answers that were not explicitly mapped.
+        for key, value in answers.items():
+            if key in _PROFILE_ORDERED_KEY_SET:
+                continue
+            formatted = _format_profile_value(value)
+            if formatted:
+                yield f"{key}: {formatted}"
 
-    if fallback_question and fallback_question.strip():
-        sections.append(f"추가 요청: {fallback_question.strip()}")
+    if fallback:
+        yield f"추가 요청: {fallback}"
 
-    return "\n".join(sections).strip()
 
+def _build_user_profile_sections(answers: dict, fallback_question: str | None) -> list[str]:
+    # 항목별 문장 리스트 (섹션 단위 배치 임베딩에 활용)
+    return list(_iter_profile_sections(answers, fallback_question))
 
-def _merge_tag_lists(existing: list[str], new_values: list[str]) -> list[str]:
-    # 전공 태그는 중복을 허용하지 않으므로 순서를 보존하며 합집합 처리
-    merged = list(existing)
-    for value in new_values:
-        if value not in merged:
-            merged.append(value)
-    return merged
+
+def _embed_profile_sections(sections: list[str]) -> list[float]:
+    # 항목별 문장을 한 번의 배치 호출로 임베딩한 뒤 평균 풀링 + L2 정규화
+    vecs = np.asarray(get_cached_embeddings().embed_documents(sections), dtype=np.float32)
+    pooled = vecs.mean(axis=0)
+    norm = np.linalg.norm(pooled)
+    if norm > 0:
+        pooled = pooled / norm
+    return pooled.tolist()
+
+
+def _max_scores_by_major_doc_type(hits) -> dict[str, dict[str, float]]:
+    # (major_id, doc_type) 그룹별 최고 점수를 NumPy로 한 번에 계산
+    # 정렬 후 그룹 경계마다 np.maximum.reduceat으로 구간 최댓값을 구한다
+    if not hits:
+        return {}
+
+    major_ids = np.array([hit.major_id for hit in hits])
+    doc_types = np.array([hit.doc_type for hit in hits])
+    scores = np.array([hit.score for hit in hits], dtype=np.float64)
+
+    order = np.lexsort((doc_types, major_ids))
+    major_ids, doc_types, scores = major_ids[order], doc_types[order], scores[order]
+
+    changed = (major_ids[1:] != major_ids[:-1]) | (doc_types[1:] != doc_types[:-1])
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    maxima = np.maximum.reduceat(scores, starts)
+
+    result: dict[str, dict[str, float]] = {}
+    for major_id, doc_type, score in zip(
+        major_ids[starts].tolist(), doc_types[starts].tolist(), maxima.tolist()
+    ):
+        result.setdefault(major_id, {})[doc_type] = score
+    return result
 
 
 def _summarize_major_hits(hits, aggregated_scores, limit: int = 10):
     # Pinecone 검색 결과를 전공별로 묶어 상위 doc_type/태그 등을 정리
     per_major: dict[str, dict] = {}
 
+    hits = [hit for hit in hits if hit.major_id]
+    # 점수 집계는 벡터화하고, 태그/샘플 문서 병합만 Python 루프에서 처리
+    doc_type_scores = _max_scores_by_major_doc_type(hits)
+
     for hit in hits:
-        if not hit.major_id:
-            continue
-        entry = per_major.setdefault(
-            hit.major_id,
-            {
+        # setdefault는 기본값 dict를 매번 만들므로 전공이 처음 나올 때만 생성
+        entry = per_major.get(hit.major_id)
+        if entry is None:
+            entry = per_major[hit.major_id] = {
                 "major_id": hit.major_id,
                 "major_name": hit.major_name,
                 "cluster": hit.metadata.get("cluster"),
                 "salary": hit.metadata.get("salary"),
                 "score": aggregated_scores.get(hit.major_id, 0.0),
-                "top_doc_types": {},
+                "top_doc_types": doc_type_scores[hit.major_id],
                 "sample_docs": [],
-                "relate_subject_tags": [],
-                "job_tags": [],
+                "relate_subject_tags": {},  # 순서 보존 집합 (마지막에 리스트로 변환)
+                "job_tags": {},
                 "summary": "",  # summary 필드 추가
-            },
-        )
-
-        entry["top_doc_types"][hit.doc_type] = max(
-            entry["top_doc_types"].get(hit.doc_type, 0.0),
-            hit.score,
-        )
+            }
 
-        if len(entry["sample_docs"]) < 3:
-            entry["sample_docs"].append(
+        # 샘플 문서는 전공당 3개까지만 보관 (가득 찬 뒤에는 dict를 만들지 않음)
+        samples = entry["sample_docs"]
+        if len(samples) < 3:
+            samples.append(
                 {
                     "doc_type": hit.doc_type,
                     "score": hit.score,
@@ -159,28 +273,43 @@ def _summarize_major_hits(hits, aggregated_scores, limit: int = 10):
         if hit.doc_type == "summary" and not entry["summary"]:
             entry["summary"] = hit.text
 
-        entry["relate_subject_tags"] = _merge_tag_lists(
-            entry["relate_subject_tags"],
-            hit.metadata.get("relate_subject_tags", []) or [],
-        )
-        entry["job_tags"] = _merge_tag_lists(
-            entry["job_tags"],
-            hit.metadata.get("job_tags", []) or [],
-        )
+        # 태그는 dict에 누적하여 hit마다 list→dict→list 변환을 반복하지 않음
+        # 태그가 없는 hit는 빈 dict 생성/병합을 건너뜀
+        subject_tags = hit.metadata.get("relate_subject_tags")
+        if subject_tags:
+            entry["relate_subject_tags"].update(dict.fromkeys(subject_tags))
+        job_tags = hit.metadata.get("job_tags")
+        if job_tags:
+            entry["job_tags"].update(dict.fromkeys(job_tags))
 
     for entry in per_major.values():
+        entry["relate_subject_tags"] = list(entry["relate_subject_tags"])
+        entry["job_tags"] = list(entry["job_tags"])
         entry["top_doc_types"] = sorted(
             entry["top_doc_types"].items(),
-            key=lambda item: item[1],
+            key=itemgetter(1),
             reverse=True,
         )
 
-    ordered = sorted(
-        per_major.values(),
-        key=lambda item: item["score"],
-        reverse=True,
-    )
-    return ordered[:limit]
+    # 전체 정렬 대신 상위 limit개만 선택 (O(n log k))
+    return heapq.nlargest(limit, per_major.values(), key=itemgetter("score"))
+
+
+# LLM 응답이 ```...``` 코드 블록으로 감싸진 경우 본문 추출용 (모듈 import 시 한 번만 컴파일)
+# 앞뒤 공백은 패턴이 아니라 호출부의 strip()으로 처리: \s*(.*?)\s* 처럼 공백을 두 수량자가
+# 나눠 가질 수 있으면 닫히지 않은 코드 블록에서 역추적이 폭발적으로 늘어남
+# 언어 태그는 ASCII이고 바로 뒤에 줄바꿈이 올 때만 인정 (\w는 한글도 매칭하므로
+# "```컴퓨터공학과, 경영학과```" 같은 한 줄 코드 블록에서 첫 학과명을 태그로 버리게 됨)
+_CODE_FENCE_RE = re.compile(r"```(?:[A-Za-z0-9_+-]*\n)?(.*?)```", re.DOTALL)
+
+
+# 전공명 정규화 프롬프트 (입력 전공명만 요청마다 달라짐)
+_NORMALIZE_MAJORS_TEMPLATE = (
+    "사용자가 입력한 대학 전공명(줄임말, 오타 포함)을 가장 적절한 '표준 학과명'으로 변환해주세요.\n"
+    "반드시 한국어 학과명만 쉼표(,)로 구분하여 출력하세요. 설명이나 다른 말은 하지 마세요.\n\n"
+    "입력: {majors}\n"
+    "출력:"
+)
 
 
 def _normalize_majors_with_llm(raw_majors: list[str]) -> list[str]:
@@ -194,33 +323,108 @@ def _normalize_majors_with_llm(raw_majors: list[str]) -> list[str]:
     # 입력이 너무 많으면 처리 비용이 크므로 제한
     targets = raw_majors[:5]
     
-    prompt = (
-        "사용자가 입력한 대학 전공명(줄임말, 오타 포함)을 가장 적절한 '표준 학과명'으로 변환해주세요.\n"
-        "반드시 한국어 학과명만 쉼표(,)로 구분하여 출력하세요. 설명이나 다른 말은 하지 마세요.\n\n"
-        f"입력: {', '.join(targets)}\n"
-        "출력:"
-    )
+    prompt = _NORMALIZE_MAJORS_TEMPLATE.format(majors=", ".join(targets))
     
     try:
-        response = llm.invoke(prompt)
+        normalizer = _get_major_normalizer()
+        if normalizer is not None:
+            # 스키마에 맞는 결과가 보장되므로 문자열 파싱 없이 바로 사용
+            result = normalizer.invoke(prompt) or {}
+            normalized = [str(item).strip() for item in result.get("majors", []) if str(item).strip()]
+            logger.debug("LLM normalized majors: %s -> %s", targets, normalized)
+            return normalized
+
+        response = _get_llm().invoke(prompt)
         content = response.content.strip()
         
+        # 지시대로 순수 텍스트가 오면 바로 분리하고,
+        # 모델이 ``` 코드 블록으로 감싼 경우에만 정규식으로 본문을 추출
+        if "```" in content:
+            fenced = _CODE_FENCE_RE.search(content)
+            if fenced:
+                content = fenced.group(1).strip()
+        
         # 쉼표로 분리하여 리스트로 변환
         normalized = [item.strip() for item in content.split(",") if item.strip()]
-        print(f"🤖 LLM Normalized Majors: {targets} -> {normalized}")
+        logger.debug("LLM normalized majors: %s -> %s", targets, normalized)
         return normalized
     except Exception as e:
-        print(f"⚠️ Failed to normalize majors with LLM: {e}")
+        logger.warning("Failed to normalize majors with LLM: %s", e)
         return targets  # 실패 시 원본 반환
 
 
+def _boost_preferred_scores(
+    aggregated_scores: dict[str, float],
+    preferred_ids: list[str],
+    factor: float = 5.0,
+) -> dict[str, float]:
+    # 선호 전공 점수를 한 번의 벡터 연산으로 factor배 강화
+    # 검색 결과에 없던 선호 전공은 기본 점수 1.0으로 추가한 뒤 강화한다
+    new_ids = [major_id for major_id in preferred_ids if major_id not in aggregated_scores]
+    major_ids = [*aggregated_scores, *new_ids]
+    scores = np.concatenate((
+        np.fromiter(aggregated_scores.values(), dtype=np.float64, count=len(aggregated_scores)),
+        np.ones(len(new_ids), dtype=np.float64),
+    ))
+
+    # major_id → 위치 dict를 매번 만들지 않고, 위치 순서 그대로 불리언 마스크를 생성
+    preferred = set(preferred_ids)
+    mask = np.fromiter((major_id in preferred for major_id in major_ids), dtype=bool, count=len(major_ids))
+    scores[mask] *= factor
+    return dict(zip(major_ids, scores.tolist()))
+
+
+# 선호 전공 검색을 프로필 검색과 겹쳐 실행하기 위한 스레드 풀
+# 이 작업은 내부에서 공용 검색 풀(_SEARCH_EXECUTOR)에 작업을 넣고 기다리므로,
+# 같은 풀을 쓰면 부하 시 풀이 가득 차 서로 기다리다 막힐 수 있어 분리한다
+_PREFERRED_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="preferred-majors")
+
+
+def _parse_preferred_majors(preferred_majors) -> list[str]:
+    # preferred_majors를 문자열("컴공, 경영") 또는 리스트로 받아 정리된 리스트로 변환
+    if isinstance(preferred_majors, str):
+        preferred_list = [m.strip() for m in preferred_majors.split(",") if m.strip()]
+    elif isinstance(preferred_majors, list):
+        preferred_list = [str(m).strip() for m in preferred_majors if str(m).strip()]
+    else:
+        preferred_list = []
+    # 중복 입력은 순서를 유지하며 제거 (LLM 정규화/검색 호출 수 감소)
+    return list(dict.fromkeys(preferred_list))
+
+
+def _search_preferred_majors(preferred_list: list[str]) -> dict[str, str]:
+    # 선호 전공을 검색하여 {major_id: major_name}을 반환 (순서 보존)
+    # 🤖 LLM을 통한 전공명 정규화 (줄임말/오타 보정)
+    # 모든 입력이 이미 표준 전공명/별칭과 정확히 일치하면 LLM 왕복을 생략
+    if all(_lookup_major_by_name(name) for name in preferred_list):
+        normalized_list = []
+    else:
+        normalized_list = _normalize_majors_with_llm(preferred_list)
+
+    # 원본과 정규화된 리스트를 합쳐서 검색 (혹시 모를 변환 오류 대비)
+    search_targets = list(dict.fromkeys([*preferred_list, *normalized_list]))
+    logger.debug("Searching for preferred majors: %s", search_targets)
+
+    # tools.py의 배치 검색 함수로 선호 전공을 한 번에 검색 (정확 매칭 + 벡터 검색)
+    # 반환된 전공은 모두 같은 5배 보너스를 받으므로 퍼지 매칭/토큰 보충 같은 느슨한 매칭은 제외
+    # (오타/줄임말은 위의 LLM 정규화가 처리)
+    # 여러 검색어에서 같은 전공이 나와도 한 번만 보너스를 받도록 순서 보존 dedup
+    preferred_names: dict[str, str] = {}
+    for preferred_matches in _find_majors_batch(search_targets, limit=5, loose_matches=False):
+        for record in preferred_matches:
+            if record.major_id:
+                preferred_names.setdefault(record.major_id, record.major_name)
+    return preferred_names
+
+
 def recommend_majors_node(state: MentorState) -> dict:
     """
     Build a user profile embedding from onboarding answers and rank majors.
     우선순위: preferred_majors 정확 매칭 > 벡터 유사도 검색
     """
     onboarding_answers = state.get("onboarding_answers") or {}
-    profile_text = _build_user_profile_text(onboarding_answers, state.get("question"))
+    profile_sections = _build_user_profile_sections(onboarding_answers, state.get("question"))
+    profile_text = "\n".join(profile_sections).strip()
 
     if not profile_text:
         return {
@@ -230,71 +434,40 @@ def recommend_majors_node(state: MentorState) -> dict:
             "major_scores": {},
         }
 
-    # 온보딩 텍스트를 단일 임베딩으로 바꿔 Pinecone 검색에 사용
-    embeddings = get_embeddings()
-    profile_embedding = embeddings.embed_query(profile_text)
+    # 🎯 preferred_majors 검색(LLM 정규화 + 배치 검색)은 프로필 검색과 독립적이므로
+    # 백그라운드에서 먼저 시작해 두 네트워크 왕복을 겹쳐 실행
+    preferred_list = _parse_preferred_majors(onboarding_answers.get("preferred_majors"))
+    preferred_future = (
+        _PREFERRED_EXECUTOR.submit(_search_preferred_majors, preferred_list)
+        if preferred_list
+        else None
+    )
+
+    # 온보딩 항목들을 배치 임베딩 후 평균 벡터로 만들어 Pinecone 검색에 사용
+    profile_embedding = _embed_profile_sections(profile_sections)
 
     hits = search_major_docs(profile_embedding, top_k=50)
     aggregated_scores = aggregate_major_scores(hits, MAJOR_DOC_WEIGHTS)
     
-    # 🎯 preferred_majors 우선 처리
-    preferred_majors = onboarding_answers.get("preferred_majors")
-    preferred_major_ids = set()
-    
-    if preferred_majors:
-        # preferred_majors를 문자열 또는 리스트로 처리
-        if isinstance(preferred_majors, str):
-            preferred_list = [m.strip() for m in preferred_majors.split(",") if m.strip()]
-        elif isinstance(preferred_majors, list):
-            preferred_list = [str(m).strip() for m in preferred_majors if str(m).strip()]
-        else:
-            preferred_list = []
-        
-        if preferred_list:
-            # 🤖 LLM을 통한 전공명 정규화 (줄임말/오타 보정)
-            normalized_list = _normalize_majors_with_llm(preferred_list)
-            
-            # 원본과 정규화된 리스트를 합쳐서 검색 (혹시 모를 변환 오류 대비)
-            search_targets = list(set(preferred_list + normalized_list))
-            
-            # tools.py의 검색 함수 사용하여 선호 전공 별도 검색
-            from backend.rag.tools import _find_majors, _MAJOR_ID_MAP, _ensure_major_records
-            _ensure_major_records()
-            
-            for preferred in search_targets:
-                print(f"🔍 Searching for preferred major: '{preferred}'")
-                
-                # 선호 전공 검색 (정확 매칭 + 벡터 검색)
-                preferred_matches = _find_majors(preferred, limit=5)
-                
-                for record in preferred_matches:
-                    if not record.major_id:
-                        continue
-                    
-                    preferred_major_ids.add(record.major_id)
-                    
-                    # 기존 hits에 없으면 추가
-                    if record.major_id not in aggregated_scores:
-                        # 새로운 전공이므로 기본 점수 1.0 부여
-                        aggregated_scores[record.major_id] = 1.0
-                        print(f"✅ Added preferred major '{record.major_name}' to results")
-                    
-                    # 보너스 점수 적용 (5배로 강화)
-                    original_score = aggregated_scores[record.major_id]
-                    aggregated_scores[record.major_id] = original_score * 5.0
-                    print(f"🎯 Boosted '{record.major_name}' score: {original_score:.2f} → {aggregated_scores[record.major_id]:.2f}")
+    # 선호 전공 점수 강화 (우선순위: preferred_majors 매칭 > 벡터 유사도)
+    if preferred_future is not None:
+        preferred_names = preferred_future.result()
+        if preferred_names:
+            aggregated_scores = _boost_preferred_scores(aggregated_scores, list(preferred_names))
+            logger.debug(
+                "Boosted %d preferred majors: %s", len(preferred_names), list(preferred_names.values())
+            )
     
     recommended = _summarize_major_hits(hits, aggregated_scores)
 
     serialized_hits = [
-        {
-            "doc_id": hit.doc_id,
-            "major_id": hit.major_id,
-            "major_name": hit.major_name,
-            "doc_type": hit.doc_type,
-            "score": hit.score,
-            "metadata": hit.metadata,
-        }
+        SerializedHit(
+            doc_id=hit.doc_id,
+            major_id=hit.major_id,
+            major_name=hit.major_name,
+            doc_type=hit.doc_type,
+            score=hit.score,
+        )
         for hit in hits
     ]
 
@@ -309,19 +482,10 @@ def recommend_majors_node(state: MentorState) -> dict:
 
 # ==================== ReAct 스타일 에이전트 노드 ====================
 
-def agent_node(state: MentorState) -> dict:
-    """
-    [ReAct 패턴] LLM이 자율적으로 tool 호출 여부를 결정.
-    """
-    messages = state.get("messages", [])
-    interests = state.get("interests")
-
-    # system_message는 interests 유무와 상관없이 항상 만들어둔다.
-    if not messages or not any(isinstance(m, SystemMessage) for m in messages):
-        interests_text = f"{interests}" if interests else "없음"
-
-        # ✅ f-string 내부 JSON 예시는 {{ }} 로 이스케이프!
-        system_message = SystemMessage(content=f"""
+# 에이전트 시스템 프롬프트 템플릿 (학생 관심사만 요청마다 달라짐)
+# 고정된 앞부분이 요청 간 바이트 단위로 동일하므로 제공자 측 프롬프트 캐시에도 유리하다.
+# ✅ str.format 템플릿이므로 JSON 예시 등 중괄호는 {{ }} 로 이스케이프!
+_AGENT_SYSTEM_TEMPLATE = """
 당신은 학생들의 전공 선택을 돕는 '대학 전공 탐색 멘토'입니다. 모든 답변은 한국어로 작성하세요.
 
 [🚨 절대 규칙 - 반드시 준수]
@@ -335,80 +499,196 @@ def agent_node(state: MentorState) -> dict:
 - 이미 받은 툴 결과가 있다면 재사용하고, 정보가 부족하면 같은 툴을 다시 호출해도 됩니다.
 - tool_calls 없이 추측하려는 경우, get_search_help()를 호출해 검색 도움말을 제공하세요.
 
-학생 관심사: {interests_text}
-""")
-                                       
-    messages = [system_message] + messages
+학생 관심사: {interests}
+"""
+
+
+# LLM이 툴 없이 답하려 할 때 재시도 요청으로 덧붙이는 고정 메시지 (요청 간 공유, 변경하지 않음)
+_FORCE_TOOL_RETRY_MESSAGE = HumanMessage(content=(
+    "❌ 오류: 당신은 툴을 사용하지 않고 답변하려고 했습니다.\n"
+    "**반드시 먼저 적절한 툴을 호출해야 합니다.**\n\n"
+    "다시 한 번 강조합니다:\n"
+    "1. list_departments: 학과 목록 검색\n"
+    "2. get_universities_by_department: 특정 학과를 개설한 대학 검색\n"
+    "3. get_major_career_info: 전공별 직업/진출 분야 확인\n"
+    "4. get_university_admission_info: 대학별 입시 정보(정시컷, 수시컷) 조회\n"
+    "5. get_search_help: 검색 도움말\n\n"
+    "학생의 원래 질문을 다시 읽고, 적절한 툴을 **지금 즉시** 호출하세요."
+))
+
+
+# agent_node가 LLM에 보내는 최대 메시지 수 (시스템 프롬프트 포함)
+_MAX_HISTORY_MESSAGES = 40
+
+
+@functools.lru_cache(maxsize=128)
+def _system_message_for(interests_text: str) -> SystemMessage:
+    # 관심사 문자열별로 SystemMessage를 한 번만 만들어 재사용
+    return SystemMessage(content=_AGENT_SYSTEM_TEMPLATE.format(interests=interests_text))
+
+
+# 최종 답변에서 강조된(`백틱`/**굵게**) 이름을 후속 질문 후보로 추출
+_FOLLOWUP_NAME_RE = re.compile(r"`([^`\n]{2,30})`|\*\*([^*\n]{2,30})\*\*")
+
+# 후속 질문 선행 로드는 추측성 작업이므로 공용 검색 풀에서 동시에 최대 1개만 실행
+_FOLLOWUP_PREFETCH_SLOT = threading.BoundedSemaphore(1)
+
+
+def _warm_followup_embeddings(names: list[str], limit: int = 3) -> None:
+    # 답변에 등장한 학과명 중 실제 전공 레코드와 일치하는 것만 골라
+    # _find_majors가 벡터 검색에 사용할 텍스트의 쿼리 임베딩을 캐시에 미리 채운다
+    try:
+        warmed = 0
+        for name in names:
+            if warmed >= limit:
+                break
+            if not _lookup_major_by_name(name):
+                continue
+            _, embed_text = _expand_category_query(name)
+            try:
+                get_cached_embeddings().embed_query(embed_text or name)
+            except Exception as exc:
+                logger.debug("Follow-up prefetch failed for %r: %s", name, exc)
+                continue
+            warmed += 1
+    finally:
+        _FOLLOWUP_PREFETCH_SLOT.release()
+
+
+def _prefetch_followups(text) -> None:
+    # 다음 턴에 학과 상세/개설 대학을 물을 가능성이 높으므로 임베딩을 백그라운드로 준비
+    if not isinstance(text, str) or not text or not get_settings().followup_prefetch:
+        return
+    names = list(dict.fromkeys(
+        (match.group(1) or match.group(2)).strip()
+        for match in _FOLLOWUP_NAME_RE.finditer(text)
+    ))
+    if not names:
+        return
+    # 실제 검색과 경쟁하지 않도록, 이전 선행 로드가 아직 실행 중이면 이번 선행 로드는 건너뜀
+    if not _FOLLOWUP_PREFETCH_SLOT.acquire(blocking=False):
+        return
+    # 다른 작업을 기다리지 않는 단순 I/O 작업이므로 공용 검색 스레드 풀에서 백그라운드 실행
+    try:
+        _SEARCH_EXECUTOR.submit(_warm_followup_embeddings, names)
+    except RuntimeError:  # 인터프리터 종료 중 등으로 풀이 닫힌 경우
+        _FOLLOWUP_PREFETCH_SLOT.release()
+
+
+def _forced_help_message() -> AIMessage:
+    # LLM이 끝까지 툴을 쓰지 않을 때 get_search_help 호출을 대신 생성
+    # tool_call id는 요청마다 고유하게 만들어 동시 요청 간 충돌을 막는다
+    return AIMessage(
+        content="",
+        tool_calls=[{
+            "name": "get_search_help",
+            "args": {},
+            "id": f"forced_search_help_{uuid.uuid4().hex}",
+        }],
+    )
+
+
+def _find_last_human(messages) -> tuple[int, HumanMessage | None]:
+    # 메시지를 뒤에서부터 한 번만 훑어 마지막 HumanMessage와 그 위치를 반환
+    # (SystemMessage/ToolMessage 존재 여부는 has_system/has_tool_results 상태 플래그로 판단)
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            return i, messages[i]
+    return -1, None
+
+
+def _trim_history(messages: list) -> list:
+    # 최근 _MAX_HISTORY_MESSAGES개만 유지 (SystemMessage는 보존, HumanMessage부터 시작하도록 잘라
+    # tool_call/ToolMessage 쌍이 깨지지 않게 함)
+    trimmed = trim_messages(
+        messages,
+        max_tokens=_MAX_HISTORY_MESSAGES,
+        token_counter=len,  # 메시지 개수 기준
+        strategy="last",
+        include_system=True,
+        start_on="human",
+        allow_partial=False,
+    )
+    if any(isinstance(message, HumanMessage) for message in trimmed):
+        return trimmed
+
+    # 마지막 질문 이후의 툴 라운드만으로 창이 넘치면 start_on="human"이 질문까지 모두 버리므로,
+    # 이 경우에는 SystemMessage + 마지막 HumanMessage와 그 이후 메시지를 그대로 유지
+    last_user_idx, _ = _find_last_human(messages)
+    if last_user_idx < 0:
+        return messages
+    head = messages[:1] if isinstance(messages[0], SystemMessage) else []
+    return [*head, *messages[last_user_idx:]]
+
+
+def agent_node(state: MentorState) -> dict:
+    """
+    [ReAct 패턴] LLM이 자율적으로 tool 호출 여부를 결정.
+    """
+    messages = state.get("messages", [])
+    interests = state.get("interests")
+
+    # SystemMessage가 아직 없을 때만 앞에 붙인다 (중복 프롬프트 전송 방지)
+    # 메시지 전체를 isinstance로 훑지 않고 상태 플래그로 O(1) 확인
+    # (호출 측이 직접 SystemMessage를 넣었다면 has_system=True를 함께 전달)
+    if not state.get("has_system", False):
+        interests_text = f"{interests}" if interests else "없음"
+        messages = [_system_message_for(interests_text), *messages]
+    else:
+        messages = list(messages)
+
+    # 긴 대화에서 매 턴 전체 기록을 다시 보내지 않도록 최근 메시지만 유지
+    if len(messages) > _MAX_HISTORY_MESSAGES:
+        messages = _trim_history(messages)
     
     # 🔍 입력 전처리: 단일 학과명 질문 감지 및 개선
-    from backend.graph.helper import is_single_major_query, enhance_single_major_query
-    
-    # 마지막 사용자 메시지 확인
-    last_user_msg = None
-    for msg in reversed(messages):
-        if isinstance(msg, HumanMessage):
-            last_user_msg = msg
-            break
+    # 마지막 사용자 메시지 확인 (역방향 1회 탐색으로 위치까지 함께 기록)
+    last_user_idx, last_user_msg = _find_last_human(messages)
     
     # 단일 학과명 질문이면 자동으로 명확한 질문으로 변환
     if last_user_msg and is_single_major_query(last_user_msg.content):
         original_query = last_user_msg.content
         enhanced_query = enhance_single_major_query(original_query)
-        print(f"🔍 Detected single major query: '{original_query}'")
-        print(f"✨ Enhanced to: '{enhanced_query}'")
+        logger.debug("Single major query enhanced: %r -> %r", original_query, enhanced_query)
         
-        # 마지막 사용자 메시지를 개선된 버전으로 교체
-        for i in range(len(messages) - 1, -1, -1):
-            if isinstance(messages[i], HumanMessage) and messages[i] == last_user_msg:
-                messages[i] = HumanMessage(content=enhanced_query)
-                break
+        # 마지막 사용자 메시지를 개선된 버전으로 교체 (탐색 시 기록한 위치 사용)
+        messages[last_user_idx] = HumanMessage(content=enhanced_query)
 
-    response = llm_with_tools.invoke(messages)
+    response = _get_llm_with_tools().invoke(messages)
 
 
     # 3. 검증: 첫 번째 사용자 질문에 대해 툴을 호출하지 않았는지 확인
     # ToolMessage가 없다는 것은 아직 툴 결과를 받지 않았다는 의미
-    from langchain_core.messages import ToolMessage
-    has_tool_results = any(isinstance(m, ToolMessage) for m in messages)
+    # → 이전 agent 턴에서 tool_calls를 내보냈다면 tools 노드가 결과를 추가했으므로 플래그로 판단
+    has_tool_results = state.get("has_tool_results", False)
 
     # 툴 결과가 없는 상태에서 LLM이 tool_calls 없이 답변하려고 하면 차단
     if not has_tool_results:
         if not hasattr(response, "tool_calls") or not response.tool_calls:
-            print("⚠️ WARNING: LLM attempted to answer without using tools. Forcing tool usage.")
+            logger.warning("LLM attempted to answer without using tools. Forcing tool usage.")
             # 강제로 재시도 메시지 추가
-            error_message = HumanMessage(content=(
-                "❌ 오류: 당신은 툴을 사용하지 않고 답변하려고 했습니다.\n"
-                "**반드시 먼저 적절한 툴을 호출해야 합니다.**\n\n"
-                "다시 한 번 강조합니다:\n"
-                "1. list_departments: 학과 목록 검색\n"
-                "2. get_universities_by_department: 특정 학과를 개설한 대학 검색\n"
-                "3. get_major_career_info: 전공별 직업/진출 분야 확인\n"
-                "4. get_university_admission_info: 대학별 입시 정보(정시컷, 수시컷) 조회\n"
-                "5. get_search_help: 검색 도움말\n\n"
-                "학생의 원래 질문을 다시 읽고, 적절한 툴을 **지금 즉시** 호출하세요."
-            ))
-            messages.append(error_message)
+            messages.append(_FORCE_TOOL_RETRY_MESSAGE)
 
             # 재시도
-            response = llm_with_tools.invoke(messages)
+            response = _get_llm_with_tools().invoke(messages)
 
             # 재시도에도 툴을 사용하지 않으면 get_search_help로 폴백
             if not hasattr(response, "tool_calls") or not response.tool_calls:
-                print("⚠️ CRITICAL: LLM still refuses to use tools. Falling back to get_search_help.")
-                from langchain_core.messages import AIMessage
+                logger.error("LLM still refuses to use tools. Falling back to get_search_help.")
                 # 강제로 get_search_help 툴 호출 생성
-                response = AIMessage(
-                    content="",
-                    tool_calls=[{
-                        "name": "get_search_help",
-                        "args": {},
-                        "id": "forced_search_help"
-                    }]
-                )
+                response = _forced_help_message()
+
+    # 최종 답변이면 답변에 언급된 학과의 후속 질문 임베딩을 미리 준비
+    if not getattr(response, "tool_calls", None):
+        _prefetch_followups(response.content)
 
     # 4. LLM의 응답(response)을 messages에 추가하여 상태 업데이트
     #    → should_continue가 tool_calls 유무를 확인하여 다음 노드 결정
-    return {"messages": [response]}
+    #    tool_calls가 있으면 다음 agent 턴에는 tools 노드의 결과가 존재하므로 플래그를 켠다
+    return {
+        "messages": [response],
+        "has_tool_results": has_tool_results or bool(getattr(response, "tool_calls", None)),
+    }
 
 
 def should_continue(state: MentorState) -> str:
@@ -11,6 +11,7 @@ from typing_extensions import NotRequired
 from langchain_core.documents import Document
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
+from backend.rag.retriever import SerializedHit
 
 class MentorState(TypedDict):
     """
@@ -24,6 +25,8 @@ class MentorState(TypedDict):
     # add_messages: 메시지를 리스트에 추가하는 reducer 함수
     # agent_node와 tools 노드 간에 메시지를 주고받을 때 사용
     messages: Annotated[List[BaseMessage], add_messages]
+    has_system: NotRequired[bool]  # messages에 호출 측이 넣은 SystemMessage가 있는지 여부 (기본 False)
+    has_tool_results: NotRequired[bool]  # tools 노드의 ToolMessage가 messages에 있는지 여부 (agent_node가 갱신)
 
     question: NotRequired[Optional[str]]  # 학생의 질문 (retrieve_node에서 사용)
     interests: Optional[str]  # 학생의 관심사/진로 방향 (현재 미사용, 향후 확장 가능)
@@ -41,6 +44,6 @@ class MentorState(TypedDict):
     onboarding_answers: NotRequired[Dict[str, Any]]  # 온보딩 단계에서 수집된 학생 선호
     user_profile_text: NotRequired[Optional[str]]  # 온보딩 정보를 요약한 텍스트
     user_profile_embedding: NotRequired[Optional[List[float]]]  # 임베딩된 학생 프로필
-    major_search_hits: NotRequired[List[Dict[str, Any]]]  # Pinecone 검색 결과 요약
+    major_search_hits: NotRequired[List[SerializedHit]]  # Pinecone 검색 결과 요약
     major_scores: NotRequired[Dict[str, float]]  # 전공별 점수 집계
     recommended_majors: NotRequired[List[Dict[str, Any]]]  # 최종 추천 전공 리스트
@@ -2,17 +2,67 @@
 """
 멘토 시스템의 메인 엔트리포인트.
 
-프론트엔드(Streamlit)에서 이 파일의 run_mentor() 함수를 호출하여
-사용자 질문에 대한 답변을 받습니다.
+프론트엔드(Streamlit)에서 이 파일의 run_mentor_stream() 함수를 호출하여
+사용자 질문에 대한 답변을 토큰 단위로 받습니다. (한 번에 받으려면 run_mentor(),
+비동기 서버에서는 arun_mentor())
 """
 
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Iterator
+
 from langchain_core.messages import HumanMessage
 from .graph.graph_builder import build_graph
+from .graph.nodes import prewarm
+from .rag.embeddings import limit_query_threads
+from .rag.tools import _get_major_records
+from .rag.university_lookup import _load_university_data
+
+logger = logging.getLogger(__name__)
+
+# 답변 캐시 (정규화된 (질문, 관심사) → 최종 답변)
+# 대화 맥락이 없는 단독 질문만 캐싱하며, 오래된 답변은 TTL이 지나면 다시 생성합니다.
+_ANSWER_CACHE_MAXSIZE = 2048
+_ANSWER_CACHE_TTL = 3600.0  # 초
+_answer_cache: "OrderedDict[tuple[str, str], tuple[float, str]]" = OrderedDict()
+_answer_cache_lock = threading.Lock()
+
+
+def _answer_cache_key(question: str, interests: str | None) -> tuple[str, str]:
+    # 전각/반각, 대소문자, 공백 차이만 있는 질문은 같은 키로 취급
+    normalized = " ".join(unicodedata.normalize("NFKC", question).lower().split())
+    return normalized, (interests or "").strip()
+
+
+def _get_cached_answer(key: tuple[str, str]) -> str | None:
+    with _answer_cache_lock:
+        entry = _answer_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, answer = entry
+        if time.monotonic() - stored_at > _ANSWER_CACHE_TTL:
+            del _answer_cache[key]
+            return None
+        _answer_cache.move_to_end(key)
+        return answer
+
+
+def _store_cached_answer(key: tuple[str, str], answer: str) -> None:
+    with _answer_cache_lock:
+        _answer_cache[key] = (time.monotonic(), answer)
+        _answer_cache.move_to_end(key)
+        if len(_answer_cache) > _ANSWER_CACHE_MAXSIZE:
+            _answer_cache.popitem(last=False)  # 가장 오래 사용되지 않은 답변 제거
 
 # 그래프 캐싱을 위한 전역 변수
 # 그래프 빌드는 비용이 높으므로, 한 번 빌드한 그래프를 재사용합니다.
 _graph_react = None
 _graph_major = None
+_graph_lock = threading.Lock()  # 동시 첫 요청 시 그래프가 중복 빌드되지 않도록 보호
 
 def get_graph(mode: str = "react"):
     """
@@ -32,17 +82,84 @@ def get_graph(mode: str = "react"):
     """
     global _graph_react, _graph_major
 
+    # double-checked locking: 빌드된 이후에는 락 없이 바로 반환
     if mode == "react":
         if _graph_react is None:
-            _graph_react = build_graph(mode="react")
+            with _graph_lock:
+                if _graph_react is None:
+                    _graph_react = build_graph(mode="react")
         return _graph_react
     elif mode == "major":
         if _graph_major is None:
-            _graph_major = build_graph(mode="major")
+            with _graph_lock:
+                if _graph_major is None:
+                    _graph_major = build_graph(mode="major")
         return _graph_major
     else:
         raise ValueError(f"Unknown mode: {mode}")
 
+
+def init_graphs() -> None:
+    """
+    ReAct / 전공 추천 그래프를 미리 빌드합니다.
+
+    서버(앱) 시작 시 한 번 호출해 두면 첫 실제 요청이 그래프 빌드 지연을 겪지 않습니다.
+    get_graph()와 같은 락을 사용하므로 요청과 동시에 실행되어도 중복 빌드되지 않습니다.
+    """
+    get_graph(mode="react")
+    get_graph(mode="major")
+
+
+def warmup() -> None:
+    """
+    첫 요청 전에 필요한 리소스를 모두 미리 로드합니다.
+
+    - ReAct / 전공 추천 그래프
+    - 임베딩 모델 (로드 실패 시 경고만 남기고 첫 요청에서 다시 시도)
+      로컬 CPU 모델이면 동시 쿼리 임베딩끼리 코어를 경합하지 않도록 torch 스레드도 제한
+    - 전공 레코드와 이름/별칭 인덱스 (major_detail.json)
+    - 대학 입시 정보 데이터와 대학명 인덱스 (university_data_cleaned.json)
+
+    모든 요청이 이 리소스를 사용하므로, 첫 요청이 JSON 파싱과 모델 로딩을
+    순서대로 떠안지 않도록 앱 시작 시 한 번 호출합니다.
+    """
+    init_graphs()
+    limit_query_threads()
+    try:
+        prewarm()
+    except Exception as exc:
+        logger.warning("Embedding model prewarm failed: %s", exc)
+    _get_major_records()
+    _load_university_data()
+
+
+def _prior_turns(question: str, chat_history: list[dict] | None) -> list[dict]:
+    # 프론트엔드는 현재 질문을 chat_history에 먼저 추가한 뒤 호출하므로,
+    # 마지막 사용자 메시지가 질문과 같으면 이전 대화가 아니라 현재 질문으로 보고 제외
+    if not chat_history:
+        return []
+    last = chat_history[-1]
+    if last.get("role") == "user" and last.get("content") == question:
+        return chat_history[:-1]
+    return chat_history
+
+
+def _build_messages(question: str, chat_history: list[dict] | None) -> list:
+    # 이전 대화 + 마지막 질문을 그래프 입력 메시지 리스트로 변환
+    # (chat_history 끝에 현재 질문이 이미 들어 있어도 한 번만 포함)
+    messages = []
+    for msg in _prior_turns(question, chat_history):
+        # LLM이 이전 메시지를 이해하고 맥락을 이어가도록 함
+        if msg["role"] == "user":
+            messages.append(HumanMessage(content=msg["content"]))
+        elif msg["role"] == "assistant":
+            messages.append(HumanMessage(content=msg["content"]))
+
+    # 마지막 질문을 추가
+    messages.append(HumanMessage(content=question))
+    return messages
+
+
 def run_mentor(question: str, interests: str | None = None, mode: str = "react", chat_history: list[dict] | None = None) -> str | dict:
     """
     멘토 시스템을 실행하여 학생의 질문에 답변합니다.
@@ -62,41 +179,141 @@ def run_mentor(question: str, interests: str | None = None, mode: str = "react",
     Returns:
         LLM이 생성한 최종 답변 문자열
     """
+    # 0. 이전 대화가 없는 단독 질문은 답변 캐시를 먼저 확인 (그래프/LLM 호출 생략)
+    cache_key = _mentor_cache_key(question, interests, mode, chat_history)
+    cached = _lookup_mentor_cache(cache_key)
+    if cached is not None:
+        return cached
+
     # 1. 캐싱된 그래프 인스턴스 가져오기
     graph = get_graph(mode=mode)
 
-    messages = []
-    if chat_history:
-        for msg in chat_history:
-            # LLM이 이전 메시지를 이해하고 맥락을 이어가도록 함
-            if msg["role"] == "user":
-                messages.append(HumanMessage(content=msg["content"]))
-            elif msg["role"] == "assistant":
-                messages.append(HumanMessage(content=msg["content"]))
+    if mode == "react":
+        # ==================== ReAct 모드 ====================
+        # 그래프 실행: agent ⇄ tools 반복하며 답변 생성
+        final_state = graph.invoke(_build_react_state(question, interests, chat_history))
+        return _answer_from_final_state(final_state, cache_key)
 
-    # 마지막 질문을 추가
-    messages.append(HumanMessage(content=question))
+
+async def arun_mentor(question: str, interests: str | None = None, mode: str = "react", chat_history: list[dict] | None = None) -> str | dict:
+    """
+    run_mentor의 비동기 버전.
+
+    graph.ainvoke로 그래프를 실행하므로, 비동기 서버(FastAPI 등)에서 요청마다 스레드를
+    점유하지 않고 여러 요청의 LLM/임베딩 API 대기 시간을 겹쳐서 처리할 수 있습니다.
+    답변 캐시와 반환 형식은 run_mentor와 같습니다.
+
+    첫 호출 시 그래프 빌드가 이벤트 루프를 막지 않도록, 서버 시작 시 init_graphs()를
+    먼저 호출해 두는 것을 권장합니다.
+    """
+    cache_key = _mentor_cache_key(question, interests, mode, chat_history)
+    cached = _lookup_mentor_cache(cache_key)
+    if cached is not None:
+        return cached
+
+    graph = get_graph(mode=mode)
 
     if mode == "react":
-        # ==================== ReAct 모드 ====================
-        # messages 기반 상태 초기화
-        state = {
-            "messages": messages,  # 사용자 메시지로 시작
-            "interests": interests,
-        }
+        final_state = await graph.ainvoke(_build_react_state(question, interests, chat_history))
+        return _answer_from_final_state(final_state, cache_key)
 
-        # 그래프 실행: agent ⇄ tools 반복하며 답변 생성
-        final_state = graph.invoke(state)
 
-        if 'awaiting_user_input' in final_state:
-            return final_state
+def _mentor_cache_key(question: str, interests: str | None, mode: str, chat_history: list[dict] | None) -> tuple[str, str] | None:
+    # 이전 대화가 없는 ReAct 단독 질문만 답변 캐시 대상
+    # (chat_history 끝에 붙은 현재 질문은 이전 대화로 치지 않음)
+    if mode == "react" and not _prior_turns(question, chat_history):
+        return _answer_cache_key(question, interests)
+    return None
+
+
+def _lookup_mentor_cache(cache_key: tuple[str, str] | None) -> str | None:
+    # 캐시 대상이 아닌 요청(cache_key=None)은 조회하지 않음
+    if cache_key is None:
+        return None
+    return _get_cached_answer(cache_key)
+
+
+def _build_react_state(question: str, interests: str | None, chat_history: list[dict] | None) -> dict:
+    # messages 기반 상태 초기화 (이전 대화 + 사용자 메시지로 시작)
+    return {
+        "messages": _build_messages(question, chat_history),
+        "interests": interests,
+    }
+
+
+def _answer_from_final_state(final_state: dict, cache_key: tuple[str, str] | None) -> str | dict:
+    if 'awaiting_user_input' in final_state:
+        return final_state
+
+    # 마지막 메시지(LLM의 최종 답변)에서 텍스트 추출
+    messages = final_state.get("messages", [])
+    if messages:
+        answer = messages[-1].content
+        if cache_key is not None and isinstance(answer, str) and answer:
+            _store_cached_answer(cache_key, answer)
+        return answer
+    return "답변을 생성할 수 없습니다."
+
+
+def run_mentor_stream(question: str, interests: str | None = None, chat_history: list[dict] | None = None) -> Iterator[str]:
+    """
+    run_mentor의 스트리밍 버전 (ReAct 모드 전용).
+
+    agent가 만드는 토큰을 생성되는 즉시 내보냅니다. 단, 툴 결과가 아직 없는 턴의 메시지는
+    곧 tool_calls로 바뀌거나(툴 사용 강제) 재시도로 버려지므로 내보내지 않고, tool_call_chunks가
+    나타난 메시지는 그 이후 토큰을 내보내지 않습니다.
+    반환(및 캐시)되는 답변은 run_mentor와 같은 최종 상태의 마지막 메시지입니다.
+
+    Args:
+        question: 학생의 질문
+        interests: 학생의 관심사/진로 방향 (선택)
+        chat_history: 이전 대화 기록 (선택)
+
+    Yields:
+        최종 답변 텍스트 조각 (토큰 단위)
+    """
+    # 단독 질문이 캐시에 있으면 그대로 한 번에 반환
+    cache_key = _mentor_cache_key(question, interests, "react", chat_history)
+    cached = _lookup_mentor_cache(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    graph = get_graph(mode="react")
+    state = _build_react_state(question, interests, chat_history)
+
+    tool_calling_ids: set[str] = set()
+    has_tool_results = False
+    streamed = False
+    final_state = None
+    for stream_mode, payload in graph.stream(state, stream_mode=["messages", "values"]):
+        if stream_mode == "values":
+            final_state = payload
+            has_tool_results = has_tool_results or bool(payload.get("has_tool_results"))
+            continue
+
+        chunk, metadata = payload
+        if metadata.get("langgraph_node") != "agent" or chunk.id in tool_calling_ids:
+            continue
+        if getattr(chunk, "tool_call_chunks", None):
+            tool_calling_ids.add(chunk.id)
+        elif has_tool_results and isinstance(chunk.content, str) and chunk.content:
+            streamed = True
+            yield chunk.content
+
+    messages = (final_state or {}).get("messages", [])
+    if not messages:
+        if not streamed:
+            yield "답변을 생성할 수 없습니다."
+        return
+
+    # 제공자가 토큰 스트리밍을 지원하지 않는 등 내보낸 토큰이 없으면 최종 답변을 한 번에 반환
+    answer = messages[-1].content
+    if not streamed:
+        yield answer
 
-        # 마지막 메시지(LLM의 최종 답변)에서 텍스트 추출
-        messages = final_state.get("messages", [])
-        if messages:
-            last_message = messages[-1]
-            return last_message.content
-        return "답변을 생성할 수 없습니다."
+    if cache_key is not None and isinstance(answer, str) and answer:
+        _store_cached_answer(cache_key, answer)
 
 
 def run_major_recommendation(onboarding_answers: dict, question: str | None = None) -> dict:
@@ -125,5 +342,6 @@ def run_major_recommendation(onboarding_answers: dict, question: str | None = No
         "user_profile_text": final_state.get("user_profile_text"),
         "recommended_majors": final_state.get("recommended_majors", []),
         "major_scores": final_state.get("major_scores", {}),
-        "major_search_hits": final_state.get("major_search_hits", []),
+        # 그래프 내부에서는 slots 데이터클래스로 다루고, 외부 반환 시에만 dict로 변환
+        "major_search_hits": [asdict(hit) for hit in final_state.get("major_search_hits", [])],
     }
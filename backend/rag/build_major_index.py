@@ -8,6 +8,7 @@ Pinecone 전공 인덱스를 처음부터 다시 구성할 때 사용하는 유
 from __future__ import annotations
 
 from backend.rag.loader import load_major_detail, build_all_major_docs
+from backend.rag.tools import clear_query_cache
 from backend.rag.vectorstore import (
     clear_major_index,
     index_major_docs,
@@ -29,6 +30,9 @@ def rebuild_major_index() -> None:
     indexed = index_major_docs(docs)
     print(f"Indexed {indexed} documents into Pinecone.")
 
+    # 같은 프로세스에 남아 있는 이전 인덱스 기준 검색 결과는 무효화
+    clear_query_cache()
+
 
 if __name__ == "__main__":
     rebuild_major_index()
@@ -9,16 +9,27 @@
 2. 사용자 질문을 벡터로 변환하여 유사한 과목 검색 (retriever.py)
 """
 # backend/rag/embeddings.py
+import hashlib
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 
-from langchain_openai import OpenAIEmbeddings
+import numpy as np
+from langchain_core.embeddings import Embeddings
 
-from backend.config import get_settings
+from backend.config import get_http_client, get_settings, resolve_device
+
+logger = logging.getLogger(__name__)
 
 # 임베딩 모델 싱글톤 캐시
 # 여러 쿼리가 동시에 실행될 때 모델을 중복 로딩하지 않도록 전역 변수에 캐싱
 # 특히 HuggingFace 모델은 로딩 시간이 길기 때문에 캐싱이 중요함
 _EMBEDDINGS_CACHE = None
+# 동시에 여러 툴 호출이 첫 로딩을 시작해도 모델이 한 번만 생성되도록 보호
+_EMBEDDINGS_LOCK = threading.Lock()
 
 
 def get_embeddings():
@@ -45,11 +56,20 @@ def get_embeddings():
     """
     global _EMBEDDINGS_CACHE
 
-    # 이미 로드된 모델이 있으면 재사용 (싱글톤 패턴)
-    # 여러 쿼리가 동시에 실행되어도 모델은 한 번만 로딩됨
+    # 이미 로드된 모델이 있으면 락 없이 바로 재사용 (싱글톤 패턴)
     if _EMBEDDINGS_CACHE is not None:
         return _EMBEDDINGS_CACHE
 
+    # 여러 쿼리가 동시에 실행되어도 모델은 한 번만 로딩됨 (double-checked locking)
+    # HuggingFace 모델을 두 번 로딩하면 시간과 (GPU) 메모리가 두 배로 듦
+    with _EMBEDDINGS_LOCK:
+        if _EMBEDDINGS_CACHE is None:
+            _EMBEDDINGS_CACHE = _create_embeddings()
+    return _EMBEDDINGS_CACHE
+
+
+def _create_embeddings():
+    # get_embeddings()의 실제 생성 로직 (_EMBEDDINGS_LOCK 안에서만 호출)
     settings = get_settings()
     provider = settings.embedding_provider.lower()
 
@@ -60,16 +80,18 @@ def get_embeddings():
     if provider == "openai":
         # OpenAI 임베딩 사용
         # 예: text-embedding-3-small (1536차원, 저렴), text-embedding-3-large (3072차원, 고품질)
-        print("Using OpenAI Embeddings")
-        _EMBEDDINGS_CACHE = OpenAIEmbeddings(
+        logger.info("Embedding provider: %s (%s)", provider, settings.embedding_model_name)
+        from langchain_openai import OpenAIEmbeddings
+
+        return OpenAIEmbeddings(
             model=settings.embedding_model_name,  # .env의 EMBEDDING_MODEL_NAME
-            openai_api_key=settings.openai_api_key
+            openai_api_key=settings.openai_api_key,
+            http_client=get_http_client(),  # LLM과 커넥션 풀 공유
         )
-        return _EMBEDDINGS_CACHE
 
     if provider == "huggingface":
         # HuggingFace 임베딩 사용 (로컬 또는 Inference API)
-        print("Using HuggingFace Embeddings")
+        logger.info("Embedding provider: %s (%s)", provider, settings.embedding_model_name)
         from langchain_huggingface import HuggingFaceEmbeddings
 
         # HuggingFace API 토큰 설정 (Inference API 사용 시 필요)
@@ -77,24 +99,268 @@ def get_embeddings():
         if hf_token:
             os.environ.setdefault("HUGGINGFACEHUB_API_TOKEN", hf_token)
 
-        # GPU 사용 설정 (로컬 모델 사용 시)
+        # 디바이스 설정 (로컬 모델 사용 시)
+        # KONKUK_DEVICE 환경 변수가 있으면 우선 사용, 없으면 CUDA 가능 여부로 자동 선택
         # GPU가 있으면 임베딩 생성 속도가 크게 향상됨
-        model_kwargs = {"device": "cuda"}      # GPU 사용 (CUDA 설치 필요)
-        # model_kwargs = {"device": "cpu"}      # CPU 사용 (GPU 없을 때)
+        device = resolve_device()
+        model_kwargs = {"device": device}
+        _configure_torch_backend(device)
 
         # 임베딩 정규화 설정
         # normalize_embeddings=True: 벡터를 단위 벡터로 정규화 (코사인 유사도 계산에 유리)
-        encode_kwargs = {"normalize_embeddings": True}
+        # batch_size=64: 문서 배치를 GPU에 크게 묶어 보내 커널 활용도를 높임
+        encode_kwargs = {"normalize_embeddings": True, "batch_size": 64}
 
-        _EMBEDDINGS_CACHE = HuggingFaceEmbeddings(
+        hf_embeddings = HuggingFaceEmbeddings(
             model_name=settings.embedding_model_name,  # 예: "upskyy/bge-m3-korean"
             model_kwargs=model_kwargs,
             encode_kwargs=encode_kwargs
         )
-        return _EMBEDDINGS_CACHE
+        try:
+            import torch
+        except ImportError:
+            return hf_embeddings
+        return _InferenceModeEmbeddings(hf_embeddings, torch.inference_mode)
 
     # 지원하지 않는 제공자
     raise ValueError(
         f"Unsupported EMBEDDING_PROVIDER: {settings.embedding_provider}. "
         "Use one of ['openai', 'huggingface']."
     )
+
+
+class _InferenceModeEmbeddings(Embeddings):
+    """
+    로컬 torch 모델 임베딩을 autograd 기록 없이(torch.inference_mode) 실행하는 래퍼
+
+    inference_mode는 스레드 로컬이므로 그래프 노드가 아니라 실제 인코딩을 호출하는 이 위치에서
+    적용합니다. (툴 스레드 풀, _QueryBatcher 등 어느 스레드에서 호출되어도 적용됨)
+    """
+
+    def __init__(self, embeddings: Embeddings, inference_mode):
+        self._embeddings = embeddings
+        self._inference_mode = inference_mode
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with self._inference_mode():
+            return self._embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        with self._inference_mode():
+            return self._embeddings.embed_query(text)
+
+
+def _configure_torch_backend(device: str) -> None:
+    # CUDA: 행렬 곱에 TF32를 허용하여 Ampere 이상 GPU에서 처리 속도 향상
+    if not device.startswith("cuda"):
+        return
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.backends.cuda.matmul.allow_tf32 = True
+
+
+def limit_query_threads() -> None:
+    """
+    대화형 서버에서 로컬 CPU 임베딩의 torch intra-op 스레드를 1개로 제한
+
+    여러 툴 호출이 동시에 쿼리를 임베딩할 때 각 호출이 모든 코어로 퍼져 서로 경합하면
+    직렬 실행보다 느려지므로, 서버 시작 시(main.warmup) 한 번 호출합니다.
+    torch.set_num_threads는 프로세스 전체에 적용되므로 임베딩 팩토리가 아닌 이곳에서만 설정하며,
+    대량 인코딩(build_major_index 등)은 모든 코어를 그대로 사용합니다.
+    로컬 HuggingFace CPU 임베딩이 아니거나 사용자가 OMP_NUM_THREADS를 직접 지정한 경우는 그대로 둡니다.
+    """
+    if get_settings().embedding_provider.lower() != "huggingface" or "OMP_NUM_THREADS" in os.environ:
+        return
+    if resolve_device() != "cpu":
+        return
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(1)
+
+
+# ==================== 임베딩 결과 캐시 ====================
+
+_CACHED_EMBEDDINGS = None
+_CACHED_EMBEDDINGS_LOCK = threading.Lock()
+
+# 동시에 들어온 단일 쿼리 임베딩을 묶기 위해 기다리는 시간(초)과 최대 배치 크기
+_QUERY_BATCH_WINDOW_SEC = 0.01
+_QUERY_BATCH_MAX_SIZE = 64
+
+
+class _QueryBatcher:
+    """
+    여러 스레드에서 동시에 요청된 단일 텍스트 임베딩을 한 번의 배치 호출로 합치는 마이크로 배처
+
+    ReAct 에이전트가 여러 툴을 병렬로 호출하면 각 툴이 쿼리를 하나씩 임베딩하여
+    API 왕복이 툴 수만큼 발생합니다. 첫 요청 스레드가 짧은 시간(window) 동안 기다린 뒤
+    그 사이 쌓인 요청을 embed_documents 한 번으로 보내고, 결과를 각 Future에 나눠 줍니다.
+    별도 백그라운드 스레드 없이 요청 스레드가 직접 배치를 처리합니다.
+
+    다른 배치가 임베딩 중일 때(실제로 동시 요청이 있을 때)만 window만큼 기다리고,
+    진행 중인 배치가 없으면 바로 보내 단일 사용자 요청에는 대기 시간이 추가되지 않습니다.
+    """
+
+    def __init__(self, embed_batch, window: float, max_batch: int):
+        self._embed_batch = embed_batch
+        self._window = window
+        self._max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, Future]] = []
+        self._in_flight = 0  # embed_batch를 호출 중인 배치 수
+
+    def embed(self, text: str) -> list[float]:
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((text, future))
+            is_leader = len(self._pending) == 1
+            is_full = len(self._pending) >= self._max_batch
+            concurrent = self._in_flight > 0
+
+        if is_full:
+            self._flush()
+        elif is_leader:
+            # 다른 배치가 진행 중이면 첫 요청 스레드가 잠시 기다리며 다른 요청이 모이도록 함
+            if concurrent:
+                time.sleep(self._window)
+            self._flush()
+        return future.result()
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            self._in_flight += 1
+
+        try:
+            vectors = self._embed_batch([text for text, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        for (_, future), vector in zip(batch, vectors):
+            future.set_result(vector)
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 결과를 프로세스 메모리에 LRU로 캐싱하는 래퍼
+
+    같은 텍스트(예: 반복되는 학생 프로필)를 다시 임베딩할 때 제공자 API 호출을
+    건너뛰고 메모리에서 바로 벡터를 반환합니다.
+
+    - 캐시 키: provider/model 이름 + 텍스트의 blake2b 해시
+      (모델을 바꾸면 키가 달라져 이전 벡터가 섞이지 않음)
+    - 캐시 값: float32 numpy 배열 (Python float 리스트 대비 메모리 절반 이하)
+    - symmetric=True: 쿼리/문서 임베딩 결과가 동일한 제공자용
+      * 쿼리와 문서가 같은 캐시 항목을 공유 (배치로 임베딩한 텍스트를 단일 쿼리로 다시 찾아도 재사용)
+      * 캐시 미스 쿼리를 _QueryBatcher로 모아 배치 임베딩
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        namespace: str,
+        maxsize: int = 4096,
+        symmetric: bool = False,
+    ):
+        self._embeddings = embeddings
+        self._namespace = namespace
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._query_kind = "document" if symmetric else "query"
+        self._batcher = (
+            _QueryBatcher(embeddings.embed_documents, _QUERY_BATCH_WINDOW_SEC, _QUERY_BATCH_MAX_SIZE)
+            if symmetric
+            else None
+        )
+
+    def _key(self, kind: str, text: str) -> str:
+        # 쿼리/문서 임베딩은 모델에 따라 결과가 다를 수 있어 kind로 구분 (symmetric이면 같은 kind 사용)
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self._namespace}:{kind}:{digest}"
+
+    def _get(self, key: str):
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+            return vector
+
+    def _put(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)  # 가장 오래 사용되지 않은 항목 제거
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key(self._query_kind, text)
+        vector = self._get(key)
+        if vector is None:
+            raw = self._batcher.embed(text) if self._batcher else self._embeddings.embed_query(text)
+            vector = np.asarray(raw, dtype=np.float32)
+            self._put(key, vector)
+        return vector.tolist()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = [self._key("document", text) for text in texts]
+        vectors = [self._get(key) for key in keys]
+
+        # 캐시에 없는 텍스트만 모아 한 번의 배치 호출로 임베딩
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            computed = self._embeddings.embed_documents([texts[i] for i in missing])
+            for i, raw in zip(missing, computed):
+                vector = np.asarray(raw, dtype=np.float32)
+                vectors[i] = vector
+                self._put(keys[i], vector)
+
+        return [vector.tolist() for vector in vectors]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def get_cached_embeddings() -> CachedEmbeddings:
+    """
+    get_embeddings() 모델을 CachedEmbeddings로 감싼 싱글톤을 반환
+
+    요청마다 반복되는 임베딩(온보딩 프로필 등)에 사용합니다.
+    Vector DB 인덱싱처럼 대량의 일회성 텍스트에는 get_embeddings()를 직접 사용하세요.
+    """
+    global _CACHED_EMBEDDINGS
+    if _CACHED_EMBEDDINGS is None:
+        with _CACHED_EMBEDDINGS_LOCK:
+            if _CACHED_EMBEDDINGS is None:
+                settings = get_settings()
+                provider = settings.embedding_provider.lower()
+                namespace = f"{provider}:{settings.embedding_model_name}"
+                _CACHED_EMBEDDINGS = CachedEmbeddings(
+                    get_embeddings(),
+                    namespace=namespace,
+                    # 두 제공자 모두 embed_query와 embed_documents 결과가 같음
+                    # (HuggingFaceEmbeddings는 query_encode_kwargs를 지정하지 않아 같은 인코딩 설정 사용)
+                    # 동시 쿼리 배치: OpenAI는 API 왕복을, HuggingFace는 모델 forward 호출을 줄임
+                    symmetric=provider in ("openai", "huggingface"),
+                )
+    return _CACHED_EMBEDDINGS
+
+
+def clear_embedding_cache() -> None:
+    """
+    임베딩 결과 캐시를 비웁니다 (모델 인스턴스는 유지). 테스트나 모델 교체 실험 시 사용합니다.
+    """
+    if _CACHED_EMBEDDINGS is not None:
+        _CACHED_EMBEDDINGS.clear()
@@ -1,5 +1,8 @@
 import json
 import re
+from pathlib import Path
+
+from backend.rag.loader import load_json
 
 def load_majors():
     """
@@ -7,9 +10,8 @@ def load_majors():
     major_categories.json 파일로 저장하는 스크립트입니다.
     """
     try:
-        # 원본 데이터 파일 로드
-        with open('/home/maroco/major_mentor/backend/data/major_detail.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # 원본 데이터 파일 로드 (orjson이 설치되어 있으면 load_json이 사용)
+        data = load_json(Path('/home/maroco/major_mentor/backend/data/major_detail.json'))
     except Exception as e:
         print(f"Error loading json: {e}")
         return
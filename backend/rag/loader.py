@@ -16,6 +16,36 @@ from typing import Any, Optional, Sequence
 
 from backend.config import get_settings, resolve_path
 
+try:
+    # 선택 의존성: 설치되어 있으면 JSON 데이터 파싱에 사용 (표준 json 대비 2~3배 빠름)
+    import orjson
+except ImportError:
+    orjson = None
+
+# 전공 레코드마다 반복 호출되는 정규식은 모듈 로드 시 한 번만 컴파일
+_SLUG_INVALID_RE = re.compile(r"[^0-9a-zA-Z]+")
+# 공백/HTML 태그/직업 구분자 패턴은 tools.py에서도 함께 사용하므로 공개 이름으로 둠
+WHITESPACE_RE = re.compile(r"\s+")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+JOB_SPLIT_RE = re.compile(r"[,\n/]")
+# HTML 태그 제거와 ":" 치환을 한 번의 탐색으로 처리 (둘 다 공백으로 바꿈)
+_SUBJECT_NOISE_RE = re.compile(r"<[^>]+>|:")
+_NUMBER_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+_MULTI_VALUE_SPLIT_RE = re.compile(r"[,/;]")
+_SUBJECT_SPLIT_RE = re.compile(r"[,/·ㆍ\n]")
+
+
+def load_json(path: Path) -> Any:
+    """
+    UTF-8 JSON 파일을 읽어 파이썬 객체로 반환한다.
+
+    orjson이 설치되어 있으면 바이트를 바로 파싱하여 문자열 디코딩 단계를 생략하고,
+    없으면 표준 json 모듈을 사용한다.
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
 
 # ==================== Major Detail Loading ====================
 
@@ -72,19 +102,19 @@ class MajorDoc:
 
 def _slugify(value: str) -> str:
     # 전공명을 Pinecone 문서 ID로 활용하기 위해 안전한 슬러그 형태로 변환
-    slug = re.sub(r"[^0-9a-zA-Z]+", "-", value.strip().lower())
+    slug = _SLUG_INVALID_RE.sub("-", value.strip().lower())
     slug = slug.strip("-")
     return slug
 
 
 def _normalize_whitespace(text: str) -> str:
     # 공백이나 줄바꿈을 하나의 공백으로 단일화
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _strip_html(value: str) -> str:
     # 간단한 HTML 태그를 제거하여 텍스트만 남김
-    return re.sub(r"<[^>]+>", " ", value or "")
+    return HTML_TAG_RE.sub(" ", value or "")
 
 
 def _parse_salary(raw_salary: Any) -> Optional[float]:
@@ -94,7 +124,7 @@ def _parse_salary(raw_salary: Any) -> Optional[float]:
     if isinstance(raw_salary, (int, float)):
         return float(raw_salary)
     if isinstance(raw_salary, str):
-        digits = re.findall(r"[0-9]+(?:\.[0-9]+)?", raw_salary.replace(",", ""))
+        digits = _NUMBER_RE.findall(raw_salary.replace(",", ""))
         if digits:
             return float(digits[0])
     return None
@@ -146,7 +176,7 @@ def _split_multi_value(value: str) -> list[str]:
     # 콤마/슬래시 등으로 구분된 학과명 문자열을 리스트로 변환
     if not value:
         return []
-    parts = re.split(r"[,/;]", value)
+    parts = _MULTI_VALUE_SPLIT_RE.split(value)
     cleaned = []
     for part in parts:
         token = part.strip()
@@ -168,68 +198,76 @@ def load_major_detail(path: str | Path | None = None) -> list[MajorRecord]:
     # 기본 경로는 설정값(MAJOR_DETAIL_PATH)을 사용
     settings = get_settings()
     json_path = Path(resolve_path(path if path else settings.major_detail_path))
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    data = load_json(json_path)
 
     records: list[MajorRecord] = []
     seen_ids: dict[str, int] = {}
 
-    for block_index, block in enumerate(data):
-        contents: Sequence[dict[str, Any]] = block.get("dataSearch", {}).get("content", []) or []
-        for content_index, payload in enumerate(contents):
-            major_name = (payload.get("major") or "").strip()
-            base_slug = _slugify(major_name) or f"major-{block_index}-{content_index}"
-            dedup_idx = seen_ids.get(base_slug, 0)
-            seen_ids[base_slug] = dedup_idx + 1
-            major_id = base_slug if dedup_idx == 0 else f"{base_slug}-{dedup_idx}"
-
-            salary = _parse_salary(payload.get("salary"))
-            department_aliases = _split_multi_value(payload.get("department", ""))
-            
-            # chartData 처리
-            chart_data = payload.get("chartData")
-            acceptance_rate = _calculate_acceptance_rate(chart_data)
-            
-            # 통계 데이터 추출 (chartData[0] 내부에 존재)
-            gender_stats = None
-            satisfaction_stats = None
-            employment_rate_stats = None
-            
-            if chart_data and isinstance(chart_data, list) and len(chart_data) > 0:
-                stats_block = chart_data[0]
-                if isinstance(stats_block, dict):
-                    gender_stats = stats_block.get("gender")
-                    satisfaction_stats = stats_block.get("satisfaction")
-                    employment_rate_stats = stats_block.get("employment_rate")
-
-            record = MajorRecord(
-                major_id=major_id,
-                major_name=major_name or f"미확인 전공 {len(records) + 1}",
-                cluster=payload.get("cluster"),
-                summary=(payload.get("summary") or "").strip(),
-                interest=(payload.get("interest") or "").strip(),
-                property=(payload.get("property") or "").strip(),
-                relate_subject=payload.get("relate_subject"),
-                job=(payload.get("job") or "").strip(),
-                enter_field=payload.get("enter_field"),
-                salary=salary,
-                employment=payload.get("employment"),
-                gender=gender_stats,
-                satisfaction=satisfaction_stats,
-                employment_rate=employment_rate_stats,
-                acceptance_rate=acceptance_rate,
-                department_aliases=department_aliases,
-                career_act=payload.get("career_act"),
-                qualifications=payload.get("qualifications"),
-                main_subject=payload.get("main_subject"),
-                university=payload.get("university"),
-                chart_data=chart_data,
-                raw=payload,
+    # 블록/콘텐츠 이중 루프를 하나의 제너레이터로 평탄화하여 한 번만 순회
+    for block_index, content_index, payload in _iter_major_payloads(data):
+        major_name = (payload.get("major") or "").strip()
+        base_slug = _slugify(major_name) or f"major-{block_index}-{content_index}"
+        dedup_idx = seen_ids.get(base_slug, 0)
+        seen_ids[base_slug] = dedup_idx + 1
+        major_id = base_slug if dedup_idx == 0 else f"{base_slug}-{dedup_idx}"
+
+        records.append(
+            _record_from_payload(
+                major_id,
+                major_name or f"미확인 전공 {len(records) + 1}",
+                payload,
             )
-            records.append(record)
+        )
 
     return records
 
 
+def _iter_major_payloads(data: Sequence[dict[str, Any]]):
+    # 데이터 구조: 리스트 -> 블록 -> "dataSearch" -> "content" -> 전공 payload 리스트
+    for block_index, block in enumerate(data):
+        contents: Sequence[dict[str, Any]] = block.get("dataSearch", {}).get("content", []) or []
+        for content_index, payload in enumerate(contents):
+            yield block_index, content_index, payload
+
+
+def _record_from_payload(major_id: str, major_name: str, payload: dict[str, Any]) -> MajorRecord:
+    # major_detail.json의 전공 payload 하나를 MajorRecord로 변환
+    get = payload.get
+
+    # chartData 처리
+    chart_data = get("chartData")
+
+    # 통계 데이터 추출 (chartData[0] 내부에 존재)
+    stats_block = chart_data[0] if isinstance(chart_data, list) and chart_data else None
+    if not isinstance(stats_block, dict):
+        stats_block = {}
+
+    return MajorRecord(
+        major_id=major_id,
+        major_name=major_name,
+        cluster=get("cluster"),
+        summary=(get("summary") or "").strip(),
+        interest=(get("interest") or "").strip(),
+        property=(get("property") or "").strip(),
+        relate_subject=get("relate_subject"),
+        job=(get("job") or "").strip(),
+        enter_field=get("enter_field"),
+        salary=_parse_salary(get("salary")),
+        employment=get("employment"),
+        gender=stats_block.get("gender"),
+        satisfaction=stats_block.get("satisfaction"),
+        employment_rate=stats_block.get("employment_rate"),
+        acceptance_rate=_calculate_acceptance_rate(chart_data),
+        department_aliases=_split_multi_value(get("department", "")),
+        career_act=get("career_act"),
+        qualifications=get("qualifications"),
+        main_subject=get("main_subject"),
+        university=get("university"),
+        chart_data=chart_data,
+        raw=payload,
+    )
+
+
 def _unique_preserve_order(values: Sequence[str]) -> list[str]:
     # Pinecone 메타데이터에 사용할 태그를 순서 유지한 채 중복 제거
     seen = set()
@@ -247,9 +285,8 @@ def _extract_subject_tags(relate_subject: Any) -> list[str]:
         return tags
 
     for item in relate_subject:
-        description = _strip_html(item.get("subject_description") or "")
-        description = re.sub(r":", " ", description)
-        parts = re.split(r"[,/·ㆍ\n]", description)
+        description = _SUBJECT_NOISE_RE.sub(" ", item.get("subject_description") or "")
+        parts = _SUBJECT_SPLIT_RE.split(description)
         for part in parts:
             candidate = part.strip()
             if len(candidate) < 2:
@@ -289,7 +326,7 @@ def _format_subject_text(relate_subject: Any) -> tuple[Optional[str], list[str],
 def _extract_job_tags(job_text: str) -> list[str]:
     # 진출 직업 문자열에서 직업명을 태그로 추출
     tags = []
-    parts = re.split(r"[,\n/]", job_text or "")
+    parts = JOB_SPLIT_RE.split(job_text or "")
     for part in parts:
         candidate = part.strip()
         if len(candidate) < 2:
@@ -395,7 +432,4 @@ def build_all_major_docs(records: list[MajorRecord]) -> list[MajorDoc]:
     """
     전체 전공 레코드를 순회하며 build_major_docs 결과를 하나의 리스트로 합친다.
     """
-    docs: list[MajorDoc] = []
-    for record in records:
-        docs.extend(build_major_docs(record))
-    return docs
+    return [doc for record in records for doc in build_major_docs(record)]
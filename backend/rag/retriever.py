@@ -14,11 +14,69 @@
 3. 문서 타입별 점수를 가중치 적용하여 전공별로 집계
 """
 # backend/rag/retriever.py
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, Hashable, List, Any, Mapping, Optional
 
 from .vectorstore import get_major_vectorstore
 
+logger = logging.getLogger(__name__)
+
+# 벡터 DB/임베딩 I/O 작업에 공용으로 사용하는 스레드 풀 (스레드는 첫 submit 시점에 생성됨)
+# 선호 전공 배치 검색, 후속 질문 임베딩 선행 로드가 함께 사용한다.
+# 다른 작업의 완료를 기다리는 작업은 넣지 않는다 (풀 고갈로 인한 교착 방지)
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="major-search")
+
+
+class QueryCache:
+    """
+    검색 결과용 스레드 안전 LRU + TTL 캐시
+
+    같은 (쿼리, k) 검색이 반복될 때 임베딩과 Pinecone 왕복을 모두 생략하기 위해 사용한다.
+    오래된 항목은 TTL이 지나면 조회 시점에 제거되고, 크기를 넘으면 가장 오래 사용되지 않은
+    항목부터 제거된다. 인덱스를 다시 구축한 뒤에는 clear()로 비운다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at <= self._ttl:
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._data[key]  # 만료된 항목 제거
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)  # 가장 오래 사용되지 않은 항목 제거
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._data), "hits": self._hits, "misses": self._misses}
+
 
 # Pinecone 검색 결과를 일관된 구조로 다루기 위한 헬퍼 데이터클래스
 @dataclass
@@ -32,6 +90,31 @@ class SearchHit:
     text: str
 
 
+# 그래프 상태(major_search_hits)로 전달하는 경량 검색 결과 (본문 text, metadata 제외)
+# metadata의 cluster/salary/태그는 이미 recommended_majors에 정리되어 있으므로 싣지 않는다
+# slots=True로 인스턴스별 __dict__ 없이 생성/접근 비용과 메모리를 줄인다
+@dataclass(slots=True)
+class SerializedHit:
+    doc_id: str
+    major_id: str
+    major_name: str
+    doc_type: str
+    score: float
+
+
+def _log_hits(hits: List[SearchHit]) -> None:
+    # 검색마다 호출되므로 print(stdout 락 + 포맷팅) 대신 logger 사용, 상위 결과 목록은 DEBUG에서만 출력
+    if not hits:
+        logger.warning("[Majors] Pinecone returned no results")
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Majors] Pinecone search returned %d hits", len(hits))
+        for hit in hits[:5]:
+            logger.debug(
+                "   - %s (%s) score=%.3f, major_id=%s",
+                hit.major_name, hit.doc_type, hit.score, hit.major_id,
+            )
+
+
 def search_major_docs(
     query_embedding: List[float],
     top_k: int = 50,
@@ -74,49 +157,40 @@ def search_major_docs(
         )
         hits.append(hit)
 
-    if not hits:
-        print("[Majors] ⚠️  Pinecone returned no results")
-    else:
-        print(f"[Majors] ✅ Pinecone search returned {len(hits)} hits")
-        for hit in hits[:5]:
-            print(
-                f"   - {hit.major_name} ({hit.doc_type}) "
-                f"score={hit.score:.3f}, major_id={hit.major_id}"
-            )
-
+    _log_hits(hits)
     return hits
 
 
 def aggregate_major_scores(
     hits: List[SearchHit],
-    doc_type_weights: Dict[str, float],
+    doc_type_weights: Mapping[str, float],
 ) -> Dict[str, float]:
     """
     문서 타입별 가중치를 반영하여 전공 단위로 점수를 합산한다.
 
     Args:
         hits: search_major_docs 결과 목록
-        doc_type_weights: doc_type → 가중치 매핑 딕셔너리
+        doc_type_weights: doc_type → 가중치 매핑 (dict 또는 MappingProxyType 등 읽기 전용 매핑)
 
     Returns:
         major_id를 키로 하고 가중 합산 점수를 값으로 가지는 딕셔너리
     """
-    # 전공별 doc_type 최고 점수를 저장
-    per_major: Dict[str, Dict[str, float]] = {}
+    # 전공별 doc_type 최고 점수와 가중 합산 점수를 한 번의 순회로 함께 갱신
+    # (최고 점수가 바뀌면 이전 점수의 기여분만큼 차감하고 새 점수를 더함)
+    best: Dict[tuple, float] = {}
+    aggregated: Dict[str, float] = {}
     for hit in hits:
         if not hit.major_id:
             continue
-        per_type = per_major.setdefault(hit.major_id, {})
-        current = per_type.get(hit.doc_type)
-        if current is None or hit.score > current:
-            per_type[hit.doc_type] = hit.score
-
-    aggregated: Dict[str, float] = {}
-    for major_id, type_scores in per_major.items():
-        total = 0.0
-        for doc_type, score in type_scores.items():
-            weight = doc_type_weights.get(doc_type, 1.0)
-            total += score * weight
-        aggregated[major_id] = total
+        key = (hit.major_id, hit.doc_type)
+        current = best.get(key)
+        if current is not None and hit.score <= current:
+            continue
+        best[key] = hit.score
+        weight = doc_type_weights.get(hit.doc_type, 1.0)
+        if current is None:
+            aggregated[hit.major_id] = aggregated.get(hit.major_id, 0.0) + hit.score * weight
+        else:
+            aggregated[hit.major_id] += (hit.score - current) * weight
 
     return aggregated
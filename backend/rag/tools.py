@@ -22,15 +22,27 @@ LLM이 사용자 질문을 분석하고, 필요시 자율적으로 이 툴들을
 
 from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.tools import tool
+import logging
 import re
-import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 from backend.config import get_settings
 
+from .embeddings import get_cached_embeddings
 from .vectorstore import get_major_vectorstore
-from .loader import load_major_detail
+from .retriever import _SEARCH_EXECUTOR, QueryCache
+from .loader import HTML_TAG_RE, JOB_SPLIT_RE, WHITESPACE_RE, load_json, load_major_detail
 from .university_lookup import lookup_university_url, search_universities
 
+try:
+    # 선택 의존성: 설치되어 있으면 오타/표기 차이가 있는 전공명을 편집 거리 기반으로 매칭
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None
+
+logger = logging.getLogger(__name__)
+
 # ==================== 상수 정의 ====================
 
 # 검색 결과 제한
@@ -39,36 +51,45 @@ MAX_UNIVERSITY_RESULTS = 50
 UNIVERSITY_PREVIEW_COUNT = 5
 VECTOR_SEARCH_MULTIPLIER = 3
 
+# 전공명 퍼지 매칭 (rapidfuzz 설치 시): 유사도 하한(0~100)과 최대 후보 수
+FUZZY_MATCH_CUTOFF = 80
+FUZZY_MATCH_LIMIT = 3
+
 # 파일 경로
 MAJOR_CATEGORIES_FILE = "major_categories.json"
 
 # 출력 포맷
 SEPARATOR_LINE = "=" * 80
 
+# 정규식 (모듈 import 시 한 번만 컴파일)
+# HTML 태그/공백/직업 구분자 패턴은 loader.py의 공개 패턴을 공유
+_CATEGORY_SPLIT_RE = re.compile(r"[\/,()]")
+_QUERY_SPLIT_RE = re.compile(r"[\/,]")
+
 
 # ==================== 로깅 유틸리티 ====================
 
 
 def _log_tool_start(tool_name: str, description: str) -> None:
     """
-    툴 실행 시작 로그 출력
+    툴 실행 시작 로그 기록 (print 대신 logger를 사용해 로그가 꺼져 있으면 포맷팅/출력 비용 없음)
     
     Args:
         tool_name: 툴 이름
         description: 실행 목적 설명
     """
-    print(f"[Tool:{tool_name}] 시작 - {description}")
+    logger.info("[Tool:%s] 시작 - %s", tool_name, description)
 
 
 def _log_tool_result(tool_name: str, outcome: str) -> None:
     """
-    툴 실행 결과 로그 출력
+    툴 실행 결과 로그 기록
     
     Args:
         tool_name: 툴 이름
         outcome: 실행 결과 요약
     """
-    print(f"[Tool:{tool_name}] 결과 - {outcome}")
+    logger.info("[Tool:%s] 결과 - %s", tool_name, outcome)
 
 
 # ==================== 사용자 가이드 ====================
@@ -123,7 +144,7 @@ def _strip_html(value: str) -> str:
     Returns:
         HTML 태그가 제거된 순수 텍스트
     """
-    return re.sub(r"<[^>]+>", " ", value or "")
+    return HTML_TAG_RE.sub(" ", value or "")
 
 
 def _normalize_major_key(value: str) -> str:
@@ -137,7 +158,7 @@ def _normalize_major_key(value: str) -> str:
     Returns:
         정규화된 전공명 (공백 제거, 소문자)
     """
-    return re.sub(r"\s+", "", (value or "").lower())
+    return WHITESPACE_RE.sub("", (value or "").lower())
 
 
 def _dedup_preserve_order(items: List[str]) -> List[str]:
@@ -184,22 +205,30 @@ def _load_major_categories() -> Dict[str, List[str]]:
         json_path = project_root / "data" / MAJOR_CATEGORIES_FILE
         
         if json_path.exists():
-            return json.loads(json_path.read_text(encoding="utf-8"))
+            return load_json(json_path)
         
-        print(f"⚠️ Major categories file not found at: {json_path}")
+        logger.warning("Major categories file not found at: %s", json_path)
         return {}
         
     except Exception as e:
         # 파일 로드 실패 시 에러 메시지 출력 및 빈 딕셔너리 반환
-        print(f"⚠️ Failed to load major categories: {e}")
+        logger.warning("Failed to load major categories: %s", e)
         return {}
 
 
 # 전공 카테고리 전역 변수 (모듈 로드 시 1회만 실행)
 MAIN_CATEGORIES = _load_major_categories()
 
+# 세부 분류 전체를 구분자(\0)로 이어 붙인 문자열
+# 쿼리에는 \0이 없으므로 `raw in _CATEGORY_DETAILS_TEXT`는
+# 모든 세부 분류를 순회하며 부분 문자열을 검사하는 것과 결과가 같다
+_CATEGORY_DETAILS_TEXT = "\0".join(
+    detail for details in MAIN_CATEGORIES.values() for detail in details
+)
+
 
-def _expand_category_query(query: str) -> Tuple[List[str], str]:
+@lru_cache(maxsize=1024)
+def _expand_category_query(query: str) -> Tuple[Tuple[str, ...], str]:
     """
     list_departments용 쿼리 확장 함수
     
@@ -213,12 +242,15 @@ def _expand_category_query(query: str) -> Tuple[List[str], str]:
         
     Returns:
         (tokens, embed_text) 튜플
-        - tokens: 검색에 사용할 키워드 리스트
+        - tokens: 검색에 사용할 키워드 튜플 (캐시 공유를 위해 불변)
         - embed_text: 벡터 임베딩에 사용할 텍스트
+    
+    같은 쿼리는 list_departments와 _find_majors에서 연달아 확장되므로
+    결과를 lru_cache로 메모이즈합니다.
     """
     raw = query.strip()
     if not raw:
-        return [], ""
+        return (), ""
 
     tokens: List[str] = []
 
@@ -227,17 +259,17 @@ def _expand_category_query(query: str) -> Tuple[List[str], str]:
         details = MAIN_CATEGORIES[raw]
         for item in details:
             # "컴퓨터 / 소프트웨어 / 인공지능" 형태를 개별 토큰으로 분리
-            parts = [p.strip() for p in re.split(r"[\/,()]", item) if p.strip()]
+            parts = [p.strip() for p in _CATEGORY_SPLIT_RE.split(item) if p.strip()]
             tokens.extend(parts)
 
     # 2) 세부 분류(value) 그대로 들어온 경우
-    elif any(raw in v for values in MAIN_CATEGORIES.values() for v in values):
-        parts = [p.strip() for p in re.split(r"[\/,()]", raw) if p.strip()]
+    elif raw in _CATEGORY_DETAILS_TEXT:
+        parts = [p.strip() for p in _CATEGORY_SPLIT_RE.split(raw) if p.strip()]
         tokens.extend(parts)
 
     # 3) 일반 텍스트 쿼리 (예: "컴퓨터 / 소프트웨어 / 인공지능", "AI, 데이터")
     else:
-        parts = [p.strip() for p in re.split(r"[\/,]", raw) if p.strip()]
+        parts = [p.strip() for p in _QUERY_SPLIT_RE.split(raw) if p.strip()]
         if parts:
             tokens.extend(parts)
         else:
@@ -249,7 +281,7 @@ def _expand_category_query(query: str) -> Tuple[List[str], str]:
     # 임베딩용 텍스트 생성
     embed_text = " ".join(dedup_tokens) if dedup_tokens else raw
     
-    return dedup_tokens, embed_text
+    return tuple(dedup_tokens), embed_text
 
 
 # ==================== 전공 레코드 캐시 관리 ====================
@@ -259,6 +291,9 @@ _MAJOR_RECORDS_CACHE: Optional[List[Any]] = None
 _MAJOR_ID_MAP: Dict[str, Any] = {}      # major_id로 빠른 조회
 _MAJOR_NAME_MAP: Dict[str, Any] = {}    # 정규화된 전공명으로 빠른 조회
 _MAJOR_ALIAS_MAP: Dict[str, Any] = {}   # 별칭으로 빠른 조회
+_MAJOR_NAME_KEYS: Tuple[Tuple[str, Any], ...] = ()  # (정규화된 전공명, 레코드) 목록 (토큰 필터용)
+_MAJOR_ALIAS_KEYS: Tuple[str, ...] = ()  # 퍼지 매칭 후보 (정규화된 전공명 + 별칭)
+_MAJOR_RECORDS_LOCK = threading.Lock()  # 앱 시작 warmup과 첫 요청이 동시에 로드하지 않도록 보호
 
 
 def _ensure_major_records() -> None:
@@ -273,15 +308,21 @@ def _ensure_major_records() -> None:
     
     이후 호출 시에는 캐시된 데이터를 재사용
     """
-    global _MAJOR_RECORDS_CACHE, _MAJOR_ID_MAP, _MAJOR_NAME_MAP, _MAJOR_ALIAS_MAP
-    
     # 이미 캐시되어 있으면 스킵
     if _MAJOR_RECORDS_CACHE is not None:
         return
 
+    with _MAJOR_RECORDS_LOCK:
+        if _MAJOR_RECORDS_CACHE is None:
+            _build_major_record_maps()
+
+
+def _build_major_record_maps() -> None:
+    # _ensure_major_records의 실제 로딩 로직 (_MAJOR_RECORDS_LOCK 안에서만 호출)
+    global _MAJOR_RECORDS_CACHE, _MAJOR_ID_MAP, _MAJOR_NAME_MAP, _MAJOR_ALIAS_MAP, _MAJOR_NAME_KEYS, _MAJOR_ALIAS_KEYS
+
     # major_detail.json 로드
     records = load_major_detail()
-    _MAJOR_RECORDS_CACHE = records
     
     # 인덱스 맵 초기화
     id_map: Dict[str, Any] = {}
@@ -308,9 +349,13 @@ def _ensure_major_records() -> None:
                 alias_map[norm_alias] = record
 
     # 전역 변수에 할당
+    # 락 없이 읽는 쪽이 레코드만 있고 인덱스는 빈 상태를 보지 않도록 레코드 캐시를 마지막에 설정
     _MAJOR_ID_MAP = id_map
     _MAJOR_NAME_MAP = name_map
     _MAJOR_ALIAS_MAP = alias_map
+    _MAJOR_NAME_KEYS = tuple((_normalize_major_key(record.major_name), record) for record in records)
+    _MAJOR_ALIAS_KEYS = tuple(alias_map)
+    _MAJOR_RECORDS_CACHE = records
 
 
 def _get_major_records() -> List[Any]:
@@ -344,40 +389,57 @@ def _lookup_major_by_name(name: str) -> Optional[Any]:
     return _MAJOR_NAME_MAP.get(key) or _MAJOR_ALIAS_MAP.get(key)
 
 
-# ==================== 벡터 검색 ====================
-
-
-def _search_major_records_by_vector(query_text: str, limit: int) -> List[Any]:
+def _fuzzy_lookup_majors(name: str) -> List[Any]:
     """
-    Pinecone 벡터 데이터베이스를 사용한 전공 검색
+    편집 거리 기반으로 전공명/별칭과 비슷한 전공 레코드 조회 (rapidfuzz 필요)
+    
+    "컴공학부", "컴퓨터공학전공"처럼 정확/별칭 매칭에 실패한 표기를 잡아냅니다.
+    rapidfuzz가 설치되어 있지 않으면 빈 리스트를 반환합니다.
     
     Args:
-        query_text: 검색 쿼리 텍스트
-        limit: 반환할 최대 결과 수
+        name: 전공명 또는 별칭
         
     Returns:
-        유사도가 높은 순으로 정렬된 MajorRecord 리스트
+        유사도 순으로 정렬된 MajorRecord 리스트 (최대 FUZZY_MATCH_LIMIT개, 중복 제거)
     """
-    if not query_text.strip():
+    if fuzz_process is None or not name:
         return []
-
-    _ensure_major_records()
     
-    # 벡터스토어 로드
-    try:
-        vectorstore = get_major_vectorstore()
-    except Exception as exc:
-        print(f"⚠️  Unable to load major vectorstore for query '{query_text}': {exc}")
+    _ensure_major_records()
+    key = _normalize_major_key(name)
+    if not key:
         return []
+    
+    # 정규화된 키에는 공백이 없으므로 토큰 기반이 아닌 문자 단위 ratio 사용
+    candidates = fuzz_process.extract(
+        key,
+        _MAJOR_ALIAS_KEYS,
+        scorer=fuzz.ratio,
+        score_cutoff=FUZZY_MATCH_CUTOFF,
+        limit=FUZZY_MATCH_LIMIT,
+    )
+    records: List[Any] = []
+    for alias, _score, _index in candidates:
+        record = _MAJOR_ALIAS_MAP[alias]
+        if record not in records:
+            records.append(record)
+    return records
 
-    # 유사도 검색 실행
-    try:
-        docs = vectorstore.similarity_search(query_text, k=max(limit, 5))
-    except Exception as exc:
-        print(f"⚠️  Vector search failed for majors query '{query_text}': {exc}")
-        return []
 
-    # 검색 결과를 MajorRecord로 변환 (중복 제거)
+# ==================== 벡터 검색 ====================
+
+
+def _records_from_docs(docs: List[Any], limit: int) -> List[Any]:
+    """
+    벡터 검색 결과 Document 리스트를 MajorRecord 리스트로 변환 (중복 제거)
+    
+    Args:
+        docs: 유사도 순으로 정렬된 LangChain Document 리스트
+        limit: 반환할 최대 결과 수
+        
+    Returns:
+        MajorRecord 리스트
+    """
     matches: List[Any] = []
     seen_ids: set[str] = set()
     
@@ -404,6 +466,109 @@ def _search_major_records_by_vector(query_text: str, limit: int) -> List[Any]:
     return matches
 
 
+# 벡터 검색 결과 캐시: (쿼리 텍스트, k) → Pinecone 결과 Document 튜플
+# 에이전트가 같은 학과/키워드를 다시 찾을 때 임베딩과 Pinecone 왕복을 모두 생략
+_VECTOR_QUERY_CACHE = QueryCache(maxsize=1024, ttl=600.0)
+
+
+def clear_query_cache() -> None:
+    """
+    벡터 검색 결과 캐시를 비웁니다. Pinecone 인덱스를 다시 구축한 뒤 호출하세요.
+    """
+    _VECTOR_QUERY_CACHE.clear()
+
+
+def _search_major_records_by_vector(query_text: str, limit: int) -> List[Any]:
+    """
+    Pinecone 벡터 데이터베이스를 사용한 전공 검색
+    
+    Args:
+        query_text: 검색 쿼리 텍스트
+        limit: 반환할 최대 결과 수
+        
+    Returns:
+        유사도가 높은 순으로 정렬된 MajorRecord 리스트
+    """
+    # 캐시/벡터스토어 로드/검색 로직은 배치 버전 하나로 관리 (단일 쿼리는 스레드 풀을 거치지 않음)
+    return _search_major_records_by_vector_batch([query_text], limit)[0]
+
+
+def _search_major_records_by_vector_batch(query_texts: List[str], limit: int) -> List[List[Any]]:
+    """
+    여러 쿼리를 한 번에 처리하는 Pinecone 벡터 검색
+    
+    쿼리 임베딩은 embed_documents 한 번의 호출로 모두 계산하고,
+    Pinecone 조회는 스레드 풀에서 동시에 실행하여 쿼리 수만큼의 순차 왕복을 없앤다.
+    검색할 쿼리가 하나뿐이면 embed_query로 임베딩하고 현재 스레드에서 바로 조회한다.
+    
+    Args:
+        query_texts: 검색 쿼리 텍스트 리스트
+        limit: 쿼리별 반환할 최대 결과 수
+        
+    Returns:
+        입력 순서와 같은 순서의 MajorRecord 리스트들
+    """
+    results: List[List[Any]] = [[] for _ in query_texts]
+    targets = [i for i, text in enumerate(query_texts) if text.strip()]
+    if not targets:
+        return results
+
+    _ensure_major_records()
+
+    # 캐시에 결과가 있는 쿼리는 바로 채우고, 나머지만 임베딩/검색
+    k = max(limit, 5)
+    pending: List[int] = []
+    for i in targets:
+        docs = _VECTOR_QUERY_CACHE.get((query_texts[i], k))
+        if docs is None:
+            pending.append(i)
+        else:
+            results[i] = _records_from_docs(docs, limit)
+    targets = pending
+    if not targets:
+        return results
+    
+    # 벡터스토어 로드
+    try:
+        vectorstore = get_major_vectorstore()
+    except Exception as exc:
+        logger.warning("Unable to load major vectorstore for majors query: %s", exc)
+        return results
+
+    # 쿼리 임베딩 계산 (캐시를 거쳐 반복/선행 로드된 쿼리의 API 호출을 생략)
+    try:
+        embeddings = get_cached_embeddings()
+        if len(targets) == 1:
+            vectors = [embeddings.embed_query(query_texts[targets[0]])]
+        else:
+            vectors = embeddings.embed_documents([query_texts[i] for i in targets])
+    except Exception as exc:
+        logger.warning("Embedding failed for majors queries: %s", exc)
+        return results
+
+    # 쿼리별 유사도 검색 (여러 개면 동시에 실행)
+    if len(targets) == 1:
+        futures = [None]
+    else:
+        futures = [
+            _SEARCH_EXECUTOR.submit(vectorstore.similarity_search_by_vector, vector, k=k)
+            for vector in vectors
+        ]
+    for i, vector, future in zip(targets, vectors, futures):
+        try:
+            if future is None:
+                docs = tuple(vectorstore.similarity_search_by_vector(vector, k=k))
+            else:
+                docs = tuple(future.result())
+        except Exception as exc:
+            logger.warning("Vector search failed for majors query '%s': %s", query_texts[i], exc)
+            continue
+        _VECTOR_QUERY_CACHE.put((query_texts[i], k), docs)
+        results[i] = _records_from_docs(docs, limit)
+
+    return results
+
+
 def _filter_records_by_tokens(tokens: List[str], limit: int) -> List[Any]:
     """
     토큰 포함 여부로 전공 레코드 필터링
@@ -428,10 +593,9 @@ def _filter_records_by_tokens(tokens: List[str], limit: int) -> List[Any]:
     results: List[Any] = []
     seen_ids: set[str] = set()
     
-    # 전체 레코드를 순회하며 필터링
-    for record in _get_major_records():
-        target = _normalize_major_key(record.major_name)
-        
+    # 전체 레코드를 순회하며 필터링 (정규화된 전공명은 로딩 시 한 번만 계산해 둔 것을 사용)
+    _ensure_major_records()
+    for target, record in _MAJOR_NAME_KEYS:
         # 모든 토큰이 전공명에 포함되어 있는지 확인
         if all(tok in target for tok in normalized):
             # 중복 제거
@@ -450,24 +614,18 @@ def _filter_records_by_tokens(tokens: List[str], limit: int) -> List[Any]:
     return results
 
 
-def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
+def _direct_major_matches(query: str, loose_matches: bool = True) -> Tuple[List[Any], set[str], Tuple[str, ...], str]:
     """
-    통합 전공 검색 함수 (4단계 검색 전략)
-    
-    검색 우선순위:
-    1. 정확히 일치하는 전공명 확인
-    2. 토큰 별칭 확인 (정확 일치 없을 시)
-    3. 벡터 유사도 검색 (항상 수행하여 연관 전공 포함)
-    4. 토큰 포함 여부 필터링 (결과 없을 시 최후의 수단)
+    _find_majors의 1~2단계 (정확 매칭 + 별칭 검색)
     
     Args:
         query: 검색 쿼리
-        limit: 반환할 최대 결과 수
+        loose_matches: False면 2-1단계 퍼지 매칭을 건너뜀
         
     Returns:
-        검색된 MajorRecord 리스트 (최대 limit개)
+        (matches, seen_ids, tokens, search_text) 튜플
+        - search_text: 3단계 벡터 검색에 사용할 텍스트
     """
-    _ensure_major_records()
     matches: List[Any] = []
     seen_ids: set[str] = set()
 
@@ -490,24 +648,54 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
                 if alias_match.major_id:
                     seen_ids.add(alias_match.major_id)
 
-    # 3단계: 벡터 유사도 검색 (항상 수행하여 연관 전공 포함)
-    search_text = embed_text or query
-    vector_matches = _search_major_records_by_vector(
-        search_text, 
-        limit=max(limit * VECTOR_SEARCH_MULTIPLIER, DEFAULT_SEARCH_LIMIT)
-    )
+    # 2-1단계: 퍼지 매칭 (오타/표기 차이, rapidfuzz 설치 시)
+    if not matches and loose_matches:
+        for fuzzy_match in _fuzzy_lookup_majors(query):
+            matches.append(fuzzy_match)
+            if fuzzy_match.major_id:
+                seen_ids.add(fuzzy_match.major_id)
+
+    return matches, seen_ids, tokens, embed_text or query
+
+
+def _merge_major_matches(
+    matches: List[Any],
+    seen_ids: set[str],
+    tokens: Tuple[str, ...],
+    vector_matches: List[Any],
+    limit: int,
+    loose_matches: bool = True,
+) -> List[Any]:
+    """
+    _find_majors의 3~4단계 (벡터 검색 결과 병합 + 토큰 필터링)
     
+    Args:
+        matches: 1~2단계에서 찾은 MajorRecord 리스트
+        seen_ids: 이미 포함된 major_id 집합
+        tokens: 쿼리 확장 토큰
+        vector_matches: 벡터 검색 결과 MajorRecord 리스트
+        limit: 반환할 최대 결과 수
+        loose_matches: False면 토큰 필터링은 앞 단계 결과가 하나도 없을 때만 수행
+        
+    Returns:
+        검색된 MajorRecord 리스트 (최대 limit개)
+    """
+    # 3단계: 벡터 유사도 검색 결과 병합 (항상 수행하여 연관 전공 포함)
+    # limit개가 채워지는 즉시 중단 (이후 결과는 어차피 잘려 나감)
     for record in vector_matches:
+        if len(matches) >= limit:
+            break
         if record.major_id and record.major_id in seen_ids:
             continue
         matches.append(record)
         if record.major_id:
             seen_ids.add(record.major_id)
-        if len(matches) >= max(limit, DEFAULT_SEARCH_LIMIT):
-            break
 
-    # 4단계: 토큰 필터링 (검색 결과가 없을 경우 최후의 수단)
-    if not matches and tokens:
+    # 4단계: 토큰 필터링 (앞 단계 결과가 limit개에 못 미치면 부족한 만큼 채움)
+    # 예: 벡터 검색 실패/부족 시 정확 매칭 1개만 반환하지 않고 토큰 매칭으로 보충
+    # loose_matches=False면 기존처럼 결과가 전혀 없을 때의 최후 수단으로만 사용
+    backfill = len(matches) < limit if loose_matches else not matches
+    if backfill and tokens:
         token_matches = _filter_records_by_tokens(tokens, limit=max(limit, DEFAULT_SEARCH_LIMIT))
         for record in token_matches:
             if record.major_id and record.major_id in seen_ids:
@@ -521,6 +709,65 @@ def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
     return matches[:limit]
 
 
+def _find_majors(query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Any]:
+    """
+    통합 전공 검색 함수 (4단계 검색 전략)
+    
+    검색 우선순위:
+    1. 정확히 일치하는 전공명 확인
+    2. 토큰 별칭 확인 (정확 일치 없을 시), 그래도 없으면 퍼지 매칭 (rapidfuzz 설치 시)
+    3. 벡터 유사도 검색 (항상 수행하여 연관 전공 포함)
+    4. 토큰 포함 여부 필터링 (결과가 limit개 미만일 때 부족분 보충)
+    
+    Args:
+        query: 검색 쿼리
+        limit: 반환할 최대 결과 수
+        
+    Returns:
+        검색된 MajorRecord 리스트 (최대 limit개)
+    """
+    _ensure_major_records()
+    matches, seen_ids, tokens, search_text = _direct_major_matches(query)
+    vector_matches = _search_major_records_by_vector(
+        search_text, 
+        limit=max(limit * VECTOR_SEARCH_MULTIPLIER, DEFAULT_SEARCH_LIMIT)
+    )
+    return _merge_major_matches(matches, seen_ids, tokens, vector_matches, limit)
+
+
+def _find_majors_batch(
+    queries: List[str],
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    loose_matches: bool = True,
+) -> List[List[Any]]:
+    """
+    여러 쿼리에 대해 _find_majors를 한 번에 수행
+    
+    1~2단계(메모리 조회)는 쿼리별로 처리하고, 3단계 벡터 검색은
+    _search_major_records_by_vector_batch로 묶어 임베딩 API 호출을 1회로 줄인다.
+    
+    Args:
+        queries: 검색 쿼리 리스트
+        limit: 쿼리별 반환할 최대 결과 수
+        loose_matches: False면 퍼지 매칭과 토큰 보충 없이 정확/별칭/벡터 매칭 위주로 반환
+            (토큰 매칭은 결과가 하나도 없을 때만 사용). 결과 전체에 같은 가중치를 주는
+            선호 전공 검색처럼 느슨한 매칭이 섞이면 안 되는 호출부용
+        
+    Returns:
+        입력 순서와 같은 순서의 MajorRecord 리스트들
+    """
+    _ensure_major_records()
+    direct_results = [_direct_major_matches(query, loose_matches) for query in queries]
+    vector_results = _search_major_records_by_vector_batch(
+        [search_text for _, _, _, search_text in direct_results],
+        limit=max(limit * VECTOR_SEARCH_MULTIPLIER, DEFAULT_SEARCH_LIMIT),
+    )
+    return [
+        _merge_major_matches(matches, seen_ids, tokens, vector_matches, limit, loose_matches)
+        for (matches, seen_ids, tokens, _), vector_matches in zip(direct_results, vector_results)
+    ]
+
+
 # ==================== 대학 정보 추출 ====================
 
 
@@ -642,7 +889,7 @@ def _extract_job_list(job_text: str) -> List[str]:
         return []
         
     # 구분자로 분리
-    parts = re.split(r"[,/\n]", job_text)
+    parts = JOB_SPLIT_RE.split(job_text)
     
     # 공백 제거 및 너무 짧은 항목 제외
     cleaned = [part.strip() for part in parts if len(part.strip()) > 1]
@@ -764,7 +1011,7 @@ def _parse_qualifications(record: Any) -> Tuple[str, List[str]]:
     else:
         text = str(raw_value).strip()
         if text:
-            parts = [p.strip() for p in re.split(r"[,/\n]", text) if p.strip()]
+            parts = [p.strip() for p in JOB_SPLIT_RE.split(text) if p.strip()]
             tokens = parts
 
     # 중복 제거
@@ -843,6 +1090,23 @@ def _resolve_major_for_career(query: str) -> Optional[Any]:
 # ==================== 출력 포맷팅 ====================
 
 
+def _format_department_entry(index: int, dept: str, universities: Optional[List[str]]) -> str:
+    """
+    학과 목록의 한 항목(번호 + 학과명 + 개설 대학 예시)을 포맷팅
+    
+    Args:
+        index: 1부터 시작하는 항목 번호
+        dept: 학과명
+        universities: 개설 대학 예시 리스트 (없으면 학과명 줄만 생성)
+        
+    Returns:
+        포맷팅된 항목 문자열 (1~2줄)
+    """
+    if universities:
+        return f"{index}. `{dept}`\n   - 개설 대학 예시: {', '.join(universities)}"
+    return f"{index}. `{dept}`"
+
+
 def _format_department_output(
     query: str,
     departments: List[str],
@@ -861,27 +1125,26 @@ def _format_department_output(
     Returns:
         포맷팅된 학과 목록 문자열
     """
-    lines = []
-    
     # 헤더
-    lines.append(SEPARATOR_LINE)
-    lines.append(f"🎯 검색 결과: '{query}'에 대한 학과 {len(departments)}개")
+    lines = [
+        SEPARATOR_LINE,
+        f"🎯 검색 결과: '{query}'에 대한 학과 {len(departments)}개",
+    ]
     if total_available is not None:
         lines.append(f"(총 {total_available}개 중 상위 {len(departments)}개 표시)")
-    lines.append(SEPARATOR_LINE)
-    lines.append("")
-    lines.append("📋 **정확한 학과명 목록** (아래 백틱 안의 이름을 그대로 복사하세요):")
-    lines.append("")
-
-    # 학과 목록
-    for i, dept in enumerate(departments, 1):
-        lines.append(f"{i}. `{dept}`")
-        
-        # 개설 대학 예시 추가
-        if dept_univ_map:
-            universities = dept_univ_map.get(dept)
-            if universities:
-                lines.append(f"   - 개설 대학 예시: {', '.join(universities)}")
+    lines += [
+        SEPARATOR_LINE,
+        "",
+        "📋 **정확한 학과명 목록** (아래 백틱 안의 이름을 그대로 복사하세요):",
+        "",
+    ]
+
+    # 학과 목록 (개설 대학 예시 포함)
+    univ_map = dept_univ_map or {}
+    lines += [
+        _format_department_entry(i, dept, univ_map.get(dept))
+        for i, dept in enumerate(departments, 1)
+    ]
 
     return "\n".join(lines)
 
@@ -912,7 +1175,7 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
     """
     raw_query = (query or "").strip()
     _log_tool_start("list_departments", f"학과 목록 조회 - query='{raw_query or '전체'}', top_k={top_k}")
-    print(f"✅ Using list_departments tool with query: '{raw_query}'")
+    logger.debug("Using list_departments tool with query: '%s'", raw_query)
 
     _ensure_major_records()
 
@@ -940,7 +1203,7 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
         all_names = sorted(set(all_names))
         limited = all_names[:top_k] if top_k else all_names
         
-        print(f"✅ Returning {len(limited)} majors out of {len(all_names)} total")
+        logger.debug("Returning %d majors out of %d total", len(limited), len(all_names))
         
         result_text = _format_department_output(
             raw_query or "전체",
@@ -954,8 +1217,8 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
 
     # 키워드 검색 처리
     tokens, embed_text = _expand_category_query(raw_query)
-    print(f"   ℹ️ Expanded query tokens: {tokens}")
-    print(f"   ℹ️ Embedding text: '{embed_text}'")
+    logger.debug("Expanded query tokens: %s", tokens)
+    logger.debug("Embedding text: '%s'", embed_text)
 
     # 통합 검색 실행
     matches = _find_majors(raw_query, limit=max(top_k, DEFAULT_SEARCH_LIMIT))
@@ -975,13 +1238,13 @@ def list_departments(query: str, top_k: int = DEFAULT_SEARCH_LIMIT) -> str:
     
     # 검색 결과가 없는 경우
     if not department_names:
-        print("⚠️  WARNING: No majors found for the given query")
+        logger.warning("No majors found for the given query")
         _log_tool_result("list_departments", "검색 결과 없음")
         return "검색 결과가 없습니다. 다른 키워드로 검색해보세요."
 
     # 결과 제한 및 포맷팅
     result = department_names[:top_k]
-    print(f"✅ Returning {len(result)} majors from major_detail vector DB")
+    logger.debug("Returning %d majors from major_detail vector DB", len(result))
     
     _log_tool_result("list_departments", f"{len(result)}개 학과 정보 반환")
     return _format_department_output(raw_query, result, dept_univ_map=dept_univ_map)
@@ -1007,7 +1270,7 @@ def get_major_career_info(major_name: str) -> Dict[str, Any]:
     """
     query = (major_name or "").strip()
     _log_tool_start("get_major_career_info", f"전공 진로 정보 조회 - major='{query}'")
-    print(f"✅ Using get_major_career_info tool for: '{query}'")
+    logger.debug("Using get_major_career_info tool for: '%s'", query)
 
     # 입력 검증
     if not query:
@@ -1022,7 +1285,7 @@ def get_major_career_info(major_name: str) -> Dict[str, Any]:
     # 전공 레코드 검색
     record = _resolve_major_for_career(query)
     if record is None:
-        print(f"⚠️  WARNING: No career data found for '{query}'")
+        logger.warning("No career data found for '%s'", query)
         result = {
             "error": "no_results",
             "message": f"'{query}' 전공의 진출 직업 정보를 찾을 수 없습니다.",
@@ -1076,15 +1339,16 @@ def get_major_career_info(major_name: str) -> Dict[str, Any]:
     if not job_list:
         response["warning"] = "데이터에 등록된 직업 목록이 없습니다."
     else:
-        print(f"✅ Retrieved {len(job_list)} jobs for '{record.major_name}'")
+        logger.debug("Retrieved %d jobs for '%s'", len(job_list), record.major_name)
 
     # 진출 분야 정보 로깅
-    if enter_field:
-        print(f"   ℹ️ Enter field categories: {[item.get('category') for item in enter_field]}")
+    # 리스트 컴프리헨션은 로그가 꺼져 있으면 만들지 않음
+    if enter_field and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Enter field categories: %s", [item.get('category') for item in enter_field])
         
     # 통계 정보 로깅
     if record.acceptance_rate:
-        print(f"   ℹ️ Acceptance rate: {record.acceptance_rate}%")
+        logger.debug("Acceptance rate: %s%%", record.acceptance_rate)
 
     # 결과 로깅
     activity_info = f"활동 {len(career_activities)}건" if career_activities else "활동 정보 없음"
@@ -1123,7 +1387,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
     """
     query = (department_name or "").strip()
     _log_tool_start("get_universities_by_department", f"학과별 대학 조회 - department='{query}'")
-    print(f"✅ Using get_universities_by_department tool for: '{query}'")
+    logger.debug("Using get_universities_by_department tool for: '%s'", query)
 
     # 입력 검증
     if not query:
@@ -1159,7 +1423,7 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
 
     # 검색 결과가 없는 경우
     if not aggregated:
-        print(f"⚠️  WARNING: No universities found offering '{query}' in major_detail.json")
+        logger.warning("No universities found offering '%s' in major_detail.json", query)
         result = [{
             "error": "no_results",
             "message": f"'{query}' 학과를 개설한 대학 정보를 major_detail 데이터에서 찾을 수 없습니다.",
@@ -1169,12 +1433,13 @@ def get_universities_by_department(department_name: str) -> List[Dict[str, str]]
         return result
 
     # 결과 로깅
-    print(f"✅ Found {len(aggregated)} university rows for '{query}'")
-    for entry in aggregated[:UNIVERSITY_PREVIEW_COUNT]:
-        print(
-            f"   - {entry.get('university')} / {entry.get('college')} / "
-            f"{entry.get('department')}"
-        )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found %d university rows for '%s'", len(aggregated), query)
+        for entry in aggregated[:UNIVERSITY_PREVIEW_COUNT]:
+            logger.debug(
+                "   - %s / %s / %s",
+                entry.get('university'), entry.get('college'), entry.get('department'),
+            )
     
     _log_tool_result("get_universities_by_department", f"총 {len(aggregated)}건 대학 정보 반환")
     return aggregated
@@ -1193,7 +1458,7 @@ def get_search_help() -> str:
     이 툴은 별도의 파라미터 없이 호출하면 됩니다.
     """
     _log_tool_start("get_search_help", "검색 가이드 안내")
-    print("ℹ️  Using get_search_help tool - providing usage guide to user")
+    logger.debug("Using get_search_help tool - providing usage guide to user")
     
     message = _get_tool_usage_guide()
     
@@ -1229,7 +1494,7 @@ def get_university_admission_info(university_name: str, department_name: str = "
         "get_university_admission_info", 
         f"대학 입시 정보 조회 - university='{query}', department='{dept}'"
     )
-    print(f"✅ Using get_university_admission_info tool for: '{query}' / '{dept}'")
+    logger.debug("Using get_university_admission_info tool for: '%s' / '%s'", query, dept)
     
     # 입력 검증
     if not query:
@@ -1245,7 +1510,7 @@ def get_university_admission_info(university_name: str, department_name: str = "
     university_info = lookup_university_url(query)
     
     if university_info is None:
-        print(f"⚠️  WARNING: No admission data found for '{query}'")
+        logger.warning("No admission data found for '%s'", query)
         
         # 유사한 대학명 검색
         similar_universities = search_universities(query)
@@ -1285,8 +1550,7 @@ def get_university_admission_info(university_name: str, department_name: str = "
     # 안내 메시지 추가
     response["guide"] = "입시제도에 대해서는 해당 URL 좌측 메뉴의 평가기준 및 입시결과를 참고해주세요!"
     
-    print(f"✅ Found admission info for '{university_info['university']}'")
-    print(f"   URL: {university_info['url']}")
+    logger.debug("Found admission info for '%s' (%s)", university_info['university'], university_info['url'])
     
     _log_tool_result(
         "get_university_admission_info",
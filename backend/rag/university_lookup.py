@@ -4,12 +4,48 @@
 university_data_cleaned.json 파일을 로드하여 대학별 KCUE 입시 정보 URL을 제공합니다.
 """
 
-import json
+import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
+from .loader import load_json
+
+logger = logging.getLogger(__name__)
+
 # 전역 캐시 변수
 _UNIVERSITY_DATA_CACHE: Optional[Dict[str, Dict[str, str]]] = None
+# 캠퍼스 표기를 뗀 대학명 → 원본 키 인덱스 (예: "서울대학교" → "서울대학교[본교]")
+_UNIVERSITY_NAME_INDEX: Dict[str, str] = {}
+# 모든 대학명에 공통으로 들어 있는 글자. 입력에 이 글자가 없으면 패턴 탐색을 건너뜀
+_UNIVERSITY_NAME_MARKER = "대"
+_UNIVERSITY_MARKER_IN_ALL = False
+
+
+def _build_name_index(data: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+    # 같은 대학명에 캠퍼스가 여러 개면 파일 순서상 첫 번째 키를 사용 (기존 순차 탐색과 동일)
+    index: Dict[str, str] = {}
+    for key in data:
+        index.setdefault(key.split("[", 1)[0].strip(), key)
+    return index
+
+
+@lru_cache(maxsize=1)
+def _university_name_pattern() -> Optional[re.Pattern]:
+    """
+    문장 안에 포함된 대학명을 한 번의 탐색으로 찾기 위한 패턴 (대학명 전체의 alternation)
+
+    200여 개 이름의 alternation 컴파일(수 ms)이 데이터 로딩(JSON 파싱 + 인덱스 생성)보다
+    훨씬 비싸므로, 로딩 시점이 아니라 이 패턴이 실제로 필요한 첫 조회 때 한 번만 컴파일합니다.
+    대부분의 조회는 정확/인덱스 매칭에서 끝나 패턴을 쓰지 않습니다.
+    _load_university_data() 이후에만 호출해야 합니다.
+    """
+    # 긴 이름을 앞에 두어 같은 위치에서 시작하는 후보 중 가장 긴 대학명이 매칭되도록 함
+    ordered = sorted(_UNIVERSITY_NAME_INDEX, key=len, reverse=True)
+    if not ordered:
+        return None
+    return re.compile("|".join(map(re.escape, ordered)))
 
 
 def _load_university_data() -> Dict[str, Dict[str, str]]:
@@ -26,7 +62,7 @@ def _load_university_data() -> Dict[str, Dict[str, str]]:
             ...
         }
     """
-    global _UNIVERSITY_DATA_CACHE
+    global _UNIVERSITY_DATA_CACHE, _UNIVERSITY_NAME_INDEX, _UNIVERSITY_MARKER_IN_ALL
     
     # 이미 캐시되어 있으면 반환
     if _UNIVERSITY_DATA_CACHE is not None:
@@ -40,16 +76,20 @@ def _load_university_data() -> Dict[str, Dict[str, str]]:
         json_path = project_root / "data" / "university_data_cleaned.json"
         
         if json_path.exists():
-            _UNIVERSITY_DATA_CACHE = json.loads(json_path.read_text(encoding="utf-8"))
-            print(f"✅ Loaded {len(_UNIVERSITY_DATA_CACHE)} universities from {json_path.name}")
+            data = load_json(json_path)
+            _UNIVERSITY_NAME_INDEX = _build_name_index(data)
+            _UNIVERSITY_MARKER_IN_ALL = all(_UNIVERSITY_NAME_MARKER in name for name in _UNIVERSITY_NAME_INDEX)
+            # 다른 스레드(앱 시작 warmup 등)가 인덱스 없이 데이터만 보지 않도록 캐시는 마지막에 설정
+            _UNIVERSITY_DATA_CACHE = data
+            logger.info("Loaded %d universities from %s", len(_UNIVERSITY_DATA_CACHE), json_path.name)
             return _UNIVERSITY_DATA_CACHE
         
-        print(f"⚠️ University data file not found at: {json_path}")
+        logger.warning("University data file not found at: %s", json_path)
         _UNIVERSITY_DATA_CACHE = {}
         return _UNIVERSITY_DATA_CACHE
         
     except Exception as e:
-        print(f"⚠️ Failed to load university data: {e}")
+        logger.warning("Failed to load university data: %s", e)
         _UNIVERSITY_DATA_CACHE = {}
         return _UNIVERSITY_DATA_CACHE
 
@@ -69,17 +109,29 @@ def lookup_university_url(university_name: str) -> Optional[Dict[str, str]]:
             "url": "https://www.adiga.kr/..."
         }
     """
-    data = _load_university_data()
-    
     if not university_name:
         return None
     
+    key = _resolve_university_key(university_name)
+    if key is None:
+        return None
+    
+    # 호출자가 결과를 수정해도 캐시/원본 데이터에 영향이 없도록 매번 새 딕셔너리로 반환
+    return {
+        "university": key,
+        **_load_university_data()[key]
+    }
+
+
+@lru_cache(maxsize=1024)
+def _resolve_university_key(university_name: str) -> Optional[str]:
+    # 대학명 → university_data_cleaned.json 키 해석 (데이터가 고정이므로 결과를 캐싱)
+    # 에이전트가 같은 대학을 반복 조회해도 부분 매칭/패턴 탐색을 다시 하지 않음
+    data = _load_university_data()
+    
     # 정확한 매칭 시도
     if university_name in data:
-        return {
-            "university": university_name,
-            **data[university_name]
-        }
+        return university_name
     
     # [본교] 등의 캠퍼스 정보가 없는 경우 자동으로 추가하여 검색
     normalized_name = university_name.strip()
@@ -88,19 +140,28 @@ def lookup_university_url(university_name: str) -> Optional[Dict[str, str]]:
     if not normalized_name.endswith("]"):
         with_campus = f"{normalized_name}[본교]"
         if with_campus in data:
-            return {
-                "university": with_campus,
-                **data[with_campus]
-            }
+            return with_campus
+    
+    # 2. 캠퍼스 표기를 제외한 대학명으로 인덱스 조회 (O(1))
+    indexed_key = _UNIVERSITY_NAME_INDEX.get(normalized_name)
+    if indexed_key is not None:
+        return indexed_key
     
-    # 2. 부분 매칭 (대학명이 포함된 경우)
+    # 3. 부분 매칭 (대학명이 포함된 경우)
     for key in data.keys():
         # "서울대학교" 입력 시 "서울대학교[본교]" 매칭
         if normalized_name in key or key.startswith(normalized_name):
-            return {
-                "university": key,
-                **data[key]
-            }
+            return key
+    
+    # 4. 질문 문장 안에 포함된 대학명 탐색 (예: "서울대학교 의예과 입시")
+    # 대학명 alternation은 입력 길이 × 후보 수만큼 비교하므로, "대"가 없는 입력은 바로 제외
+    if _UNIVERSITY_MARKER_IN_ALL and _UNIVERSITY_NAME_MARKER not in normalized_name:
+        return None
+    pattern = _university_name_pattern()
+    if pattern is not None:
+        match = pattern.search(normalized_name)
+        if match:
+            return _UNIVERSITY_NAME_INDEX[match.group(0)]
     
     return None
 
@@ -120,15 +181,19 @@ def search_universities(query: str) -> list[Dict[str, str]]:
     if not query:
         return []
     
-    normalized_query = query.strip().lower()
-    results = []
-    
-    for key, value in data.items():
-        # 대학명에 쿼리가 포함되어 있으면 추가
-        if normalized_query in key.lower():
-            results.append({
-                "university": key,
-                **value
-            })
-    
-    return results
+    return [
+        {
+            "university": key,
+            **data[key]
+        }
+        for key in _search_university_keys(query.strip().lower())
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _search_university_keys(normalized_query: str) -> tuple[str, ...]:
+    # 대학명에 쿼리가 포함된 키 목록 (파일 순서 유지, 반복 검색 시 전체 순회 생략)
+    return tuple(
+        key for key in _load_university_data()
+        if normalized_query in key.lower()
+    )
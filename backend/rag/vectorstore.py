@@ -145,6 +145,10 @@ def get_major_vectorstore():
     """
     # LangChain VectorStore 인터페이스를 재사용하기 위해 싱글톤으로 구성
     global _MAJOR_VECTORSTORE_CACHE
+    # 생성 이후에는 락 없이 바로 반환 (검색마다 호출되므로 동시 툴 호출 간 락 경합을 피함)
+    if _MAJOR_VECTORSTORE_CACHE is not None:
+        return _MAJOR_VECTORSTORE_CACHE
+
     with _MAJOR_VECTORSTORE_LOCK:
         if _MAJOR_VECTORSTORE_CACHE is not None:
             return _MAJOR_VECTORSTORE_CACHE
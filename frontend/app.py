@@ -8,7 +8,7 @@
 1. 채팅 기반 인터페이스 (Streamlit Chat)
 2. 관심사 입력 기능 (사이드바)
 3. 대화 기록 관리 (Session State)
-4. 실시간 응답 (run_mentor 함수 호출)
+4. 실시간 응답 (run_mentor_stream 토큰 스트리밍)
 
 ** 실행 방법 **
 ```bash
@@ -16,10 +16,12 @@ streamlit run frontend/app.py
 ```
 """
 # frontend/app.py
+import itertools
+import re
 import streamlit as st
-import time
 from pathlib import Path
 import sys
+import threading
 
 # ==================== 경로 설정 ====================
 # backend 모듈을 import하기 위해 프로젝트 루트를 Python 경로에 추가
@@ -27,7 +29,7 @@ ROOT_DIR = Path(__file__).resolve().parents[1]  # frontend의 부모 = 프로젝
 sys.path.append(str(ROOT_DIR))
 
 # ==================== Backend 모듈 Import ====================
-from backend.main import run_mentor, run_major_recommendation  # 백엔드 메인 함수
+from backend.main import run_mentor_stream, run_major_recommendation, warmup  # 백엔드 메인 함수
 from backend.config import get_settings  # 설정 로드
 
 # ==================== 설정 로드 및 콘솔 출력 ====================
@@ -37,6 +39,16 @@ print(
     f"with model '{settings.model_name}'"
 )
 
+
+@st.cache_resource
+def _warm_up_backend() -> bool:
+    # 프로세스당 한 번, 온보딩이 진행되는 동안 백그라운드에서 그래프/데이터/임베딩을 미리 로드
+    threading.Thread(target=warmup, name="backend-warmup", daemon=True).start()
+    return True
+
+
+_warm_up_backend()
+
 # ==================== 카테고리 및 온보딩 정의 ====================
 
 ONBOARDING_QUESTIONS = [
@@ -99,6 +111,8 @@ if "onboarding_complete" not in st.session_state:
     st.session_state.onboarding_complete = False
 if "major_recommendations" not in st.session_state:
     st.session_state.major_recommendations = None
+if "major_cards" not in st.session_state:
+    st.session_state.major_cards = None  # 추천 카드 표시용 문자열 (추천 수신 시 1회 생성)
 if "major_profile_text" not in st.session_state:
     st.session_state.major_profile_text = ""
 if "major_scores" not in st.session_state:
@@ -113,21 +127,6 @@ if "force_recalc_major" not in st.session_state:
     st.session_state.force_recalc_major = False
 
 
-def response_generator(text: str):
-    """텍스트를 단어 단위로 스트리밍하는 제너레이터"""
-    # None이나 비어있는 경우 처리
-    if not text:
-        return
-        
-    # 딕셔너리 등 문자열이 아닌 경우 문자열로 변환
-    if not isinstance(text, str):
-        text = str(text)
-
-    for word in text.split(" "):
-        yield word + " "
-        time.sleep(0.02)
-
-
 def ensure_onboarding_flow():
     """초기 4단계 선호도 조사가 끝날 때까지 채팅 UI를 잠시 숨긴다."""
     if st.session_state.onboarding_complete:
@@ -175,6 +174,36 @@ def ensure_onboarding_flow():
     st.stop()
 
 
+def build_major_cards(recs: list[dict]) -> list[dict]:
+    """추천 결과 TOP 5를 화면 표시용 문자열로 한 번만 변환한다 (rerun마다 다시 포맷하지 않도록)."""
+    cards = []
+    for idx, major in enumerate(recs[:5], start=1):
+        score = major.get("score", 0.0)
+        cluster = major.get("cluster") or "계열 정보 없음"
+        salary = major.get("salary")
+        tags = major.get("relate_subject_tags", [])[:5]
+        doc_types = ", ".join(
+            f"{doc_type}({doc_score:.2f})"
+            for doc_type, doc_score in major.get("top_doc_types", [])
+        )
+
+        lines = [f"- 계열: {cluster}"]
+        if salary is not None:
+            salary_text = f"{salary}만원" if isinstance(salary, (int, float)) else f"{salary}"
+            lines.append(f"- 평균 초봉 지표: {salary_text}")
+        if doc_types:
+            lines.append(f"- 주요 근거: {doc_types}")
+        if tags:
+            lines.append(f"- 연관 과목 태그: {', '.join(tags)}")
+
+        cards.append({
+            "title": f"**{idx}. {major['major_name']}** · 점수 {score:.2f}",
+            "lines": lines,
+            "summary": major.get("summary", ""),
+        })
+    return cards
+
+
 def ensure_major_recommendations(force: bool = False):
     """온보딩이 완료되면 Pinecone 기반 전공 추천을 호출한다."""
     if not st.session_state.onboarding_complete:
@@ -193,6 +222,7 @@ def ensure_major_recommendations(force: bool = False):
             )
         except Exception as exc:
             st.session_state.major_recommendations = []
+            st.session_state.major_cards = []
             st.session_state.major_profile_text = ""
             st.session_state.major_scores = {}
             st.session_state.major_hits = []
@@ -201,6 +231,7 @@ def ensure_major_recommendations(force: bool = False):
             return
 
     st.session_state.major_recommendations = result.get("recommended_majors", [])
+    st.session_state.major_cards = build_major_cards(st.session_state.major_recommendations)
     st.session_state.major_profile_text = result.get("user_profile_text", "")
     st.session_state.major_scores = result.get("major_scores", {})
     st.session_state.major_hits = result.get("major_search_hits", [])
@@ -235,31 +266,20 @@ def render_major_recommendations_section():
             st.caption("학생 프로필 요약")
             st.code(st.session_state.major_profile_text.strip())
 
-        for idx, major in enumerate(recs[:5], start=1):
-            score = major.get("score", 0.0)
-            cluster = major.get("cluster") or "계열 정보 없음"
-            salary = major.get("salary")
-            tags = major.get("relate_subject_tags", [])[:5]
-            doc_types = ", ".join(
-                f"{doc_type}({doc_score:.2f})"
-                for doc_type, doc_score in major.get("top_doc_types", [])
-            )
+        # 추천을 받아올 때 미리 만들어 둔 표시용 문자열을 그대로 렌더링
+        cards = st.session_state.major_cards
+        if cards is None:
+            cards = st.session_state.major_cards = build_major_cards(recs)
+        for card in cards:
             with st.container():
-                st.markdown(f"**{idx}. {major['major_name']}** · 점수 {score:.2f}")
-                st.write(f"- 계열: {cluster}")
-                if salary is not None:
-                    salary_text = f"{salary}만원" if isinstance(salary, (int, float)) else f"{salary}"
-                    st.write(f"- 평균 초봉 지표: {salary_text}")
-                if doc_types:
-                    st.write(f"- 주요 근거: {doc_types}")
-                if tags:
-                    st.write(f"- 연관 과목 태그: {', '.join(tags)}")
+                st.markdown(card["title"])
+                for line in card["lines"]:
+                    st.write(line)
                 
                 # summary 필드 표시
-                summary_text = major.get("summary", "")
-                if summary_text:
+                if card["summary"]:
                     st.caption("상세 설명")
-                    st.markdown(summary_text)
+                    st.markdown(card["summary"])
 
     rerun_col1, rerun_col2 = st.columns([1, 4])
     with rerun_col1:
@@ -309,10 +329,15 @@ ensure_major_recommendations(force=force_flag)
 render_major_recommendations_section()
 st.divider()
 
+# 커리큘럼 키워드를 하나의 패턴으로 합쳐 한 번의 탐색으로 검사
+# ("전체 커리큘럼", "커리큘럼을"은 "커리큘럼"에 포함되므로 별도 항목 불필요)
+_CURRICULUM_KEYWORDS_RE = re.compile(
+    "|".join(map(re.escape, ["커리큘럼", "학기별", "학년별", "수업 순서"]))
+)
+
 # 커리큘럼 키워드 감지 함수
 def is_curriculum_query(text: str) -> bool:
-    keywords = ["커리큘럼", "학기별", "전체 커리큘럼", "학년별", "수업 순서", "커리큘럼을"]
-    return any(keyword in text for keyword in keywords)
+    return _CURRICULUM_KEYWORDS_RE.search(text) is not None
 
 # 버튼 렌더링 함수
 def render_format_options_inline(original_question: str):
@@ -398,31 +423,31 @@ if prompt:
 
     # 3. 백엔드 호출하여 답변 생성
     with st.chat_message("assistant"):
-        # 로딩 스피너 표시
-        with st.spinner("멘토가 과목 정보를 검토 중입니다..."):
-            run_question = prompt
-            if st.session_state.get('internal_marker'):
-                run_question = f"{prompt} {st.session_state.get('internal_marker')}"
-
-            # 온보딩 프로필을 컨텍스트로 전달
-            profile_context = (
-                st.session_state.interests
-                or st.session_state.major_profile_text
-            )
+        run_question = prompt
+        if st.session_state.get('internal_marker'):
+            run_question = f"{prompt} {st.session_state.get('internal_marker')}"
+
+        # 온보딩 프로필을 컨텍스트로 전달
+        profile_context = (
+            st.session_state.interests
+            or st.session_state.major_profile_text
+        )
 
-            raw_response: str | dict = run_mentor(
-                question=run_question,
-                interests=profile_context or None,
-                chat_history=st.session_state.messages
-            )
+        token_stream = run_mentor_stream(
+            question=run_question,
+            interests=profile_context or None,
+            chat_history=st.session_state.messages
+        )
+
+        # 첫 토큰이 도착할 때까지만 로딩 스피너 표시 (툴 검색 단계)
+        with st.spinner("멘토가 과목 정보를 검토 중입니다..."):
+            first_token = next(token_stream, "")
 
-            if st.session_state.get('internal_marker'):
-                del st.session_state['internal_marker']
+        if st.session_state.get('internal_marker'):
+            del st.session_state['internal_marker']
         
-        # 일반 텍스트 응답 처리
-        response_content = raw_response
-        # 스트리밍 출력 적용
-        st.write_stream(response_generator(response_content))
+        # LLM 토큰을 생성되는 즉시 출력
+        response_content = st.write_stream(itertools.chain([first_token], token_stream))
 
     # Add assistant response to chat history
     st.session_state.messages.append({"role": "assistant", "content": response_content})
@@ -0,0 +1,84 @@
+"""backend.rag.embeddings 쿼리 마이크로 배처 / inference_mode 래퍼 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from backend.rag import embeddings
+
+
+def _fake_embed_batch(calls):
+    def embed_batch(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    return embed_batch
+
+
+def test_single_query_is_sent_without_waiting(monkeypatch):
+    calls = []
+    monkeypatch.setattr(embeddings.time, "sleep", lambda _: (_ for _ in ()).throw(AssertionError("slept")))
+    batcher = embeddings._QueryBatcher(_fake_embed_batch(calls), window=0.01, max_batch=64)
+
+    assert batcher.embed("컴퓨터") == [3.0]
+    assert calls == [["컴퓨터"]]
+
+
+def test_queries_arriving_during_a_batch_are_grouped():
+    calls = []
+    release_first = threading.Event()
+    first_started = threading.Event()
+
+    def embed_batch(texts):
+        if not calls:
+            first_started.set()
+            release_first.wait(timeout=5)
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    batcher = embeddings._QueryBatcher(embed_batch, window=0.2, max_batch=64)
+    results = {}
+
+    def run(text):
+        results[text] = batcher.embed(text)
+
+    first = threading.Thread(target=run, args=("a",))
+    first.start()
+    assert first_started.wait(timeout=5)
+
+    # 첫 배치가 진행 중일 때 들어온 요청들은 window 동안 모여 한 번에 전송
+    others = [threading.Thread(target=run, args=(text,)) for text in ("bb", "ccc")]
+    for thread in others:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while len(batcher._pending) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release_first.set()
+    for thread in [first, *others]:
+        thread.join(timeout=5)
+
+    assert calls[0] == ["a"]
+    assert sorted(calls[1]) == ["bb", "ccc"]
+    assert results == {"a": [1.0], "bb": [2.0], "ccc": [3.0]}
+
+
+def test_inference_mode_applies_in_worker_threads():
+    torch = pytest.importorskip("torch")
+    seen = []
+
+    class _Recording:
+        def embed_documents(self, texts):
+            seen.append(torch.is_inference_mode_enabled())
+            return [[0.0] for _ in texts]
+
+        def embed_query(self, text):
+            seen.append(torch.is_inference_mode_enabled())
+            return [0.0]
+
+    wrapped = embeddings._InferenceModeEmbeddings(_Recording(), torch.inference_mode)
+    worker = threading.Thread(target=lambda: (wrapped.embed_query("a"), wrapped.embed_documents(["b"])))
+    worker.start()
+    worker.join(timeout=5)
+
+    assert seen == [True, True]
@@ -0,0 +1,25 @@
+"""backend.graph.graph_builder 빌드 테스트"""
+
+from backend.graph import graph_builder, nodes
+
+
+def test_building_graphs_does_not_load_embeddings(monkeypatch):
+    def fail():
+        raise AssertionError("graph build should not load the embedding model")
+
+    monkeypatch.setattr(nodes, "get_cached_embeddings", fail)
+
+    assert graph_builder.build_react_graph() is not None
+    assert graph_builder.build_major_graph() is not None
+
+
+def test_build_graph_is_cached_per_mode_regardless_of_call_style(monkeypatch):
+    graph_builder._build_graph.cache_clear()
+    builds = []
+    monkeypatch.setattr(graph_builder, "build_react_graph", lambda: builds.append("react") or object())
+
+    first = graph_builder.build_graph()
+    assert graph_builder.build_graph("react") is first
+    assert graph_builder.build_graph(mode="react") is first
+    assert builds == ["react"]
+    graph_builder._build_graph.cache_clear()
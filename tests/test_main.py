@@ -0,0 +1,131 @@
+"""backend.main 답변 캐시/스트리밍 동작 테스트 (그래프는 가짜 객체로 대체)"""
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from backend import main
+
+
+class _GraphNotExpected:
+    def __getattr__(self, name):
+        raise AssertionError("graph should not be used on a cache hit")
+
+
+class _FakeGraph:
+    def __init__(self, answer: str):
+        self.answer = answer
+        self.invoked = []
+
+    def invoke(self, state):
+        self.invoked.append(state)
+        return {"messages": [*state["messages"], main.HumanMessage(content=self.answer)]}
+
+
+class _FakeStreamGraph:
+    """agent가 툴을 호출하기 전 텍스트를 쓰고, 툴 결과를 본 뒤 최종 답변을 토큰 단위로 내는 흐름"""
+
+    def __init__(self):
+        self.finished = False
+
+    def stream(self, state, stream_mode):
+        agent = {"langgraph_node": "agent"}
+        tool_call = {"name": "list_departments", "args": {}, "id": "call-1"}
+        yield "messages", (AIMessageChunk(content="검색해 볼게요.", id="run-1"), agent)
+        yield "messages", (AIMessageChunk(content="", id="run-1", tool_call_chunks=[
+            {"name": "list_departments", "args": "{}", "id": "call-1", "index": 0}]), agent)
+        tool_turn = AIMessage(content="검색해 볼게요.", id="run-1", tool_calls=[tool_call])
+        yield "values", {"messages": [*state["messages"], tool_turn], "has_tool_results": True}
+        yield "messages", (ToolMessage(content="[]", tool_call_id="call-1"), {"langgraph_node": "tools"})
+        yield "messages", (AIMessageChunk(content="최종 ", id="run-2"), agent)
+        yield "messages", (AIMessageChunk(content="답변", id="run-2"), agent)
+        yield "values", {
+            "messages": [*state["messages"], tool_turn, AIMessage(content="최종 답변", id="run-2")],
+            "has_tool_results": True,
+        }
+        self.finished = True
+
+
+@pytest.fixture(autouse=True)
+def _clear_answer_cache():
+    main._answer_cache.clear()
+    yield
+    main._answer_cache.clear()
+
+
+def _app_history(question: str) -> list[dict]:
+    # frontend/app.py는 현재 질문을 session_state.messages에 추가한 뒤 그대로 넘긴다
+    return [{"role": "user", "content": question}]
+
+
+def test_stream_uses_cache_with_app_calling_convention(monkeypatch):
+    question = "컴퓨터공학과 진로 알려줘"
+    main._store_cached_answer(main._answer_cache_key(question, None), "캐시된 답변")
+    monkeypatch.setattr(main, "get_graph", lambda mode="react": _GraphNotExpected())
+
+    chunks = list(main.run_mentor_stream(question, chat_history=_app_history(question)))
+
+    assert chunks == ["캐시된 답변"]
+
+
+def test_run_mentor_caches_answer_with_app_calling_convention(monkeypatch):
+    question = "경영학과 개설 대학"
+    graph = _FakeGraph("생성된 답변")
+    monkeypatch.setattr(main, "get_graph", lambda mode="react": graph)
+
+    first = main.run_mentor(question, chat_history=_app_history(question))
+    second = main.run_mentor(question, chat_history=_app_history(question))
+
+    assert first == second == "생성된 답변"
+    assert len(graph.invoked) == 1
+    # 현재 질문이 history 끝에 있어도 그래프 입력에는 한 번만 들어간다
+    assert [m.content for m in graph.invoked[0]["messages"]] == [question]
+
+
+def test_prior_turns_disable_cache():
+    question = "그 학과 취업률은?"
+    history = [
+        {"role": "user", "content": "컴퓨터공학과 알려줘"},
+        {"role": "assistant", "content": "컴퓨터공학과는 ..."},
+        {"role": "user", "content": question},
+    ]
+
+    assert main._mentor_cache_key(question, None, "react", history) is None
+    assert main._mentor_cache_key(question, None, "react", history[-1:]) is not None
+
+
+def test_stream_skips_text_of_tool_calling_turns(monkeypatch):
+    question = "인공지능 관련 학과 추천해줘"
+    monkeypatch.setattr(main, "get_graph", lambda mode="react": _FakeStreamGraph())
+
+    chunks = list(main.run_mentor_stream(question, chat_history=_app_history(question)))
+
+    assert chunks == ["최종 ", "답변"]
+    assert main._get_cached_answer(main._answer_cache_key(question, None)) == "최종 답변"
+
+
+def test_stream_yields_first_token_before_graph_finishes(monkeypatch):
+    graph = _FakeStreamGraph()
+    monkeypatch.setattr(main, "get_graph", lambda mode="react": graph)
+
+    stream = main.run_mentor_stream("인공지능 관련 학과 추천해줘")
+
+    assert next(stream) == "최종 "
+    assert not graph.finished
+    assert list(stream) == ["답변"]
+    assert graph.finished
+
+
+def test_warmup_survives_embedding_prewarm_failure(monkeypatch):
+    def fail():
+        raise RuntimeError("model download failed")
+
+    loaded = []
+    monkeypatch.setattr(main, "init_graphs", lambda: loaded.append("graphs"))
+    monkeypatch.setattr(main, "limit_query_threads", lambda: loaded.append("threads"))
+    monkeypatch.setattr(main, "prewarm", fail)
+    monkeypatch.setattr(main, "_get_major_records", lambda: loaded.append("majors"))
+    monkeypatch.setattr(main, "_load_university_data", lambda: loaded.append("universities"))
+
+    main.warmup()
+
+    assert loaded == ["graphs", "threads", "majors", "universities"]
@@ -0,0 +1,112 @@
+"""backend.graph.nodes 메시지 트리밍 / 전공명 정규화 응답 파싱 / 후속 질문 선행 로드 테스트"""
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from backend.graph import nodes
+
+
+def _tool_round(i: int) -> list:
+    call = {"name": "list_departments", "args": {"query": str(i)}, "id": f"call-{i}"}
+    return [
+        AIMessage(content="", tool_calls=[call]),
+        ToolMessage(content="[]", tool_call_id=f"call-{i}"),
+    ]
+
+
+def test_trim_history_keeps_recent_window():
+    system = SystemMessage(content="system")
+    history = [HumanMessage(content=f"q{i}") if i % 2 == 0 else AIMessage(content=f"a{i}") for i in range(60)]
+
+    trimmed = nodes._trim_history([system, *history])
+
+    assert trimmed[0] is system
+    assert len(trimmed) <= nodes._MAX_HISTORY_MESSAGES
+    assert isinstance(trimmed[1], HumanMessage)
+    assert trimmed[-1] is history[-1]
+
+
+def test_trim_history_keeps_last_question_when_tool_rounds_fill_window():
+    system = SystemMessage(content="system")
+    question = HumanMessage(content="컴퓨터공학과 개설 대학과 진로 알려줘")
+    rounds = [message for i in range(25) for message in _tool_round(i)]  # 질문 뒤 50개 메시지
+    messages = [system, HumanMessage(content="이전 질문"), AIMessage(content="이전 답변"), question, *rounds]
+
+    trimmed = nodes._trim_history(messages)
+
+    assert trimmed == [system, question, *rounds]
+
+
+class _FakeResponse:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _FakeLLM:
+    def __init__(self, content: str):
+        self.content = content
+
+    def invoke(self, prompt):
+        return _FakeResponse(self.content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "컴퓨터공학과, 경영학과",
+        "```컴퓨터공학과, 경영학과```",
+        "```\n컴퓨터공학과, 경영학과\n```",
+        "```text\n컴퓨터공학과, 경영학과\n```",
+    ],
+)
+def test_normalize_majors_parses_code_fences(monkeypatch, content):
+    monkeypatch.setattr(nodes, "_get_major_normalizer", lambda: None)
+    monkeypatch.setattr(nodes, "_get_llm", lambda: _FakeLLM(content))
+
+    assert nodes._normalize_majors_with_llm(["컴공", "경영"]) == ["컴퓨터공학과", "경영학과"]
+
+
+class _RecordingExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+
+
+_FOLLOWUP_ANSWER = "`컴퓨터공학과`와 **경영학과**를 추천합니다."
+
+
+def test_prefetch_followups_respects_setting(monkeypatch):
+    executor = _RecordingExecutor()
+    monkeypatch.setattr(nodes, "_SEARCH_EXECUTOR", executor)
+    monkeypatch.setattr(nodes, "get_settings", lambda: SimpleNamespace(followup_prefetch=False))
+
+    nodes._prefetch_followups(_FOLLOWUP_ANSWER)
+
+    assert executor.submitted == []
+
+
+def test_prefetch_followups_runs_at_most_one_task(monkeypatch):
+    executor = _RecordingExecutor()
+    monkeypatch.setattr(nodes, "_SEARCH_EXECUTOR", executor)
+    monkeypatch.setattr(nodes, "get_settings", lambda: SimpleNamespace(followup_prefetch=True))
+
+    nodes._prefetch_followups(_FOLLOWUP_ANSWER)
+    nodes._prefetch_followups(_FOLLOWUP_ANSWER)  # 첫 작업이 끝나지 않았으므로 건너뜀
+
+    assert executor.submitted == [(["컴퓨터공학과", "경영학과"],)]
+    nodes._FOLLOWUP_PREFETCH_SLOT.release()
+
+
+def test_prefetch_followups_releases_slot_when_warm_finishes(monkeypatch):
+    monkeypatch.setattr(nodes, "_lookup_major_by_name", lambda name: None)
+    assert nodes._FOLLOWUP_PREFETCH_SLOT.acquire(blocking=False)
+
+    nodes._warm_followup_embeddings(["컴퓨터공학과"])
+
+    # 선행 로드가 끝나면 다음 선행 로드가 슬롯을 다시 얻을 수 있다
+    assert nodes._FOLLOWUP_PREFETCH_SLOT.acquire(blocking=False)
+    nodes._FOLLOWUP_PREFETCH_SLOT.release()
@@ -0,0 +1,35 @@
+"""backend.rag.tools 전공 검색 단계 테스트 (벡터 검색은 빈 결과로 대체)"""
+
+import pytest
+
+from backend.rag import tools
+
+
+@pytest.fixture(autouse=True)
+def _no_vector_search(monkeypatch):
+    monkeypatch.setattr(
+        tools,
+        "_search_major_records_by_vector_batch",
+        lambda query_texts, limit: [[] for _ in query_texts],
+    )
+
+
+def test_find_majors_batch_backfills_with_token_matches():
+    (matches,) = tools._find_majors_batch(["공학"], limit=5)
+
+    assert matches[0] is tools._lookup_major_by_name("공학")
+    assert len(matches) == 5
+
+
+def test_find_majors_batch_strict_skips_token_backfill():
+    # 선호 전공 보너스 경로: 정확 매칭이 있으면 느슨한 토큰 매칭을 섞지 않는다
+    (matches,) = tools._find_majors_batch(["공학"], limit=5, loose_matches=False)
+
+    assert matches == [tools._lookup_major_by_name("공학")]
+
+
+def test_find_majors_batch_strict_uses_tokens_only_without_other_matches():
+    (matches,) = tools._find_majors_batch(["기계"], limit=5, loose_matches=False)
+
+    assert matches
+    assert all("기계" in record.major_name for record in matches)